@@ -6,19 +6,22 @@ import contextlib
 import json
 import logging
 import os
-from functools import lru_cache
+import sys
+from functools import cached_property, lru_cache
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from threading import Lock
-from typing import Any, Dict, Literal, Optional
+from typing import Any, Callable, Dict, Literal, Optional
 from urllib.parse import urlparse
 
+import orjson
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
     PrivateAttr,
     ValidationError,
+    field_validator,
     model_validator,
 )
 
@@ -26,23 +29,49 @@ logger = logging.getLogger(__name__)
 
 _OVERRIDE_FILENAME = "backend_endpoint.override.json"
 _override_lock = Lock()
-_OVERRIDE_KEYS = {
-    "deployment",
-    "pronaia_api_base",
-    "pronaia_client_id",
-    "pronaia_client_secret",
-    "verify_ssl",
-}
-_NULLABLE_OVERRIDE_KEYS = {
-    "pronaia_client_id",
-    "pronaia_client_secret",
+_override_cache: Dict[Path, tuple[int, Dict[str, Any]]] = {}
+_STORAGE_DIR_READY: set[Path] = set()
+_OVERRIDE_KEYS = frozenset(
+    {
+        "deployment",
+        "pronaia_api_base",
+        "pronaia_client_id",
+        "pronaia_client_secret",
+        "verify_ssl",
+    }
+)
+_NULLABLE_OVERRIDE_KEYS = frozenset(
+    {
+        "pronaia_client_id",
+        "pronaia_client_secret",
+    }
+)
+def _identity(value: str) -> str:
+    return value
+
+
+_STR_NORMALIZERS: Dict[str, Callable[[str], str]] = {"deployment": str.lower}
+_DEPLOYMENT_PATHS: dict[str, tuple[str, str, str]] = {
+    mode: tuple(sys.intern(path) for path in paths)
+    for mode, paths in {
+        "cloud": (
+            "/v1/transcribe",
+            "/v1/transcribe/{transcribe_id}",
+            "/v1/transcribe:streaming",
+        ),
+        "onprem": (
+            "/api/v2/batch",
+            "/api/v2/batch/{transcribe_id}",
+            "/api/v1/transcribe:streaming",
+        ),
+    }.items()
 }
 
 
 class Settings(BaseModel):
     """Runtime configuration loaded from environment variables."""
 
-    model_config = ConfigDict(populate_by_name=True, extra="ignore")
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
 
     google_oauth_client_id: Optional[str] = Field(default=None, alias="GOOGLE_OAUTH_CLIENT_ID")
     google_oauth_client_secret: Optional[str] = Field(default=None, alias="GOOGLE_OAUTH_CLIENT_SECRET")
@@ -75,6 +104,8 @@ class Settings(BaseModel):
         300.0, alias="STT_TRANSCRIBE_QUEUE_TIMEOUT", gt=0.0
     )
     verify_ssl: bool = Field(True, alias="STT_VERIFY_SSL")
+    http_max_connections: int = Field(100, alias="STT_HTTP_MAX_CONNECTIONS", ge=1)
+    http_max_keepalive: int = Field(20, alias="STT_HTTP_MAX_KEEPALIVE", ge=0)
     deployment: Literal["cloud", "onprem"] = Field("cloud", alias="STT_DEPLOYMENT")
     collector_url: Optional[str] = Field(default=None, alias="STT_COLLECTOR_URL")
     collector_timeout_seconds: float = Field(
@@ -91,43 +122,37 @@ class Settings(BaseModel):
         default=None, alias="CORS_ALLOWED_ORIGINS"
     )
 
-    _transcribe_path: str = PrivateAttr("/v1/transcribe")
-    _transcribe_status_path: str = PrivateAttr("/v1/transcribe/{transcribe_id}")
-    _streaming_path: str = PrivateAttr("/v1/transcribe:streaming")
     _cors_allowed_origins: tuple[str, ...] = PrivateAttr(default=())
 
+    @field_validator("storage_base_dir", mode="before")
+    @classmethod
+    def _norm_storage_base_dir(cls, value: Any) -> Any:
+        return _expand_path(value) if value is not None else value
+
+    @field_validator("pronaia_api_base", "collector_url", mode="before")
+    @classmethod
+    def _norm_api_base(cls, value: Any) -> Any:
+        return _strip_trailing_slash(value) if value is not None else value
+
+    @field_validator("deployment", mode="before")
+    @classmethod
+    def _norm_deployment(cls, value: Any) -> Any:
+        return _normalize_deployment(value) if value is not None else value
+
+    @field_validator("stt_config_path", mode="before")
+    @classmethod
+    def _norm_config_path(cls, value: Any) -> Any:
+        return _resolve_config_path(value) if value else value
+
     @model_validator(mode="after")
-    def _prepare(self) -> "Settings":
-        """Normalize paths and ensure directories exist."""
-        base_dir = Path(self.storage_base_dir).expanduser()
-        base_dir.mkdir(parents=True, exist_ok=True)
-        self.storage_base_dir = base_dir
-        self.pronaia_api_base = str(self.pronaia_api_base).rstrip("/")
-        deployment = str(self.deployment).lower()
-        if deployment not in {"cloud", "onprem"}:
-            raise ValueError(f"Invalid STT deployment mode: {self.deployment}")
-        self.deployment = deployment  # type: ignore[assignment]
-        if self.deployment == "cloud":
-            self._transcribe_path = "/v1/transcribe"
-            self._transcribe_status_path = "/v1/transcribe/{transcribe_id}"
-            self._streaming_path = "/v1/transcribe:streaming"
-        else:
-            self._transcribe_path = "/api/v2/batch"
-            self._transcribe_status_path = "/api/v2/batch/{transcribe_id}"
-            self._streaming_path = "/api/v1/transcribe:streaming"
-        if self.collector_url:
-            self.collector_url = str(self.collector_url).rstrip("/")
-        if self.stt_config_path:
-            config_path = Path(self.stt_config_path).expanduser()
-            if not config_path.is_file():
-                raise ValueError(f"STT config path does not exist: {config_path}")
-            self.stt_config_path = config_path
+    def _finalize(self) -> "Settings":
+        """Parse derived values that must fail at construction time."""
         self._cors_allowed_origins = _parse_cors_allowed_origins(
             self.cors_allowed_origins_raw
         )
         return self
 
-    @property
+    @cached_property
     def auth_enabled(self) -> bool:
         """Return True when both client ID and secret are configured."""
         return bool(self.pronaia_client_id and self.pronaia_client_secret)
@@ -173,19 +198,19 @@ class Settings(BaseModel):
             self.google_oauth_credentials_configured and self.google_oauth_storage_ready
         )
 
-    @property
+    @cached_property
     def transcribe_path(self) -> str:
-        return self._transcribe_path
+        return _DEPLOYMENT_PATHS[self.deployment][0]
 
-    @property
+    @cached_property
     def transcribe_status_path(self) -> str:
-        return self._transcribe_status_path
+        return _DEPLOYMENT_PATHS[self.deployment][1]
 
-    @property
+    @cached_property
     def streaming_path(self) -> str:
-        return self._streaming_path
+        return _DEPLOYMENT_PATHS[self.deployment][2]
 
-    @property
+    @cached_property
     def collector_enabled(self) -> bool:
         """Return True when collector URL is configured."""
         return bool(self.collector_url)
@@ -195,12 +220,47 @@ class Settings(BaseModel):
         """Return the configured public-web origins allowed for CORS."""
         return self._cors_allowed_origins
 
-    @property
+    @cached_property
     def has_stt_config(self) -> bool:
         """Return True when an external STT config was provided."""
         return self.stt_config_path is not None
 
 
+def _expand_path(value: Any) -> Path:
+    return Path(value).expanduser()
+
+
+def _strip_trailing_slash(value: str) -> str:
+    return value.rstrip("/")
+
+
+def _normalize_deployment(value: str) -> str:
+    deployment = value.lower()
+    if deployment not in _DEPLOYMENT_PATHS:
+        raise ValueError(f"Invalid STT deployment mode: {value}")
+    return deployment
+
+
+def _resolve_config_path(value: Any) -> Path:
+    config_path = Path(value).expanduser()
+    if not config_path.is_file():
+        raise ValueError(f"STT config path does not exist: {config_path}")
+    return config_path
+
+
+_FIELD_TABLE: tuple[tuple[str, str, bool], ...] = tuple(
+    (name, field_info.alias or name, field_info.is_required())
+    for name, field_info in Settings.model_fields.items()
+)
+
+
+@lru_cache(maxsize=1)
+def _required_aliases() -> tuple[tuple[str, str], ...]:
+    return tuple(
+        (name, alias) for name, alias, required in _FIELD_TABLE if required
+    )
+
+
 def _normalize_cors_origin(value: str) -> str:
     origin = value.strip()
     if not origin:
@@ -265,15 +325,21 @@ def _parse_cors_allowed_origins(value: Optional[str]) -> tuple[str, ...]:
     return tuple(normalized)
 
 
+@lru_cache(maxsize=8)
+def _resolve_storage_base_dir_cached(raw: str) -> Path:
+    base_dir = Path(raw).expanduser()
+    base_dir.mkdir(parents=True, exist_ok=True)
+    return base_dir
+
+
 def _resolve_storage_base_dir(value: Optional[str] = None) -> Path:
     base_value = value or os.environ.get("STT_STORAGE_BASE_DIR")
     if not base_value:
         raise RuntimeError("STT_STORAGE_BASE_DIR is not configured.")
-    base_dir = Path(base_value).expanduser()
-    base_dir.mkdir(parents=True, exist_ok=True)
-    return base_dir
+    return _resolve_storage_base_dir_cached(str(base_value))
 
 
+@lru_cache(maxsize=8)
 def _runtime_override_path(base_dir: Path) -> Path:
     return base_dir / _OVERRIDE_FILENAME
 
@@ -293,10 +359,7 @@ def _normalize_override_payload(data: Dict[str, Any]) -> Dict[str, Any]:
                 if key in _NULLABLE_OVERRIDE_KEYS:
                     normalized[key] = None
                 continue
-            if key == "deployment":
-                normalized[key] = trimmed.lower()
-            else:
-                normalized[key] = trimmed
+            normalized[key] = _STR_NORMALIZERS.get(key, _identity)(trimmed)
             continue
         normalized[key] = value
     return normalized
@@ -304,21 +367,50 @@ def _normalize_override_payload(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def _load_override_payload(base_dir: Path) -> Dict[str, Any]:
     path = _runtime_override_path(base_dir)
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _override_cache.pop(path, None)
         return {}
+    cached = _override_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
     try:
-        content = path.read_text(encoding="utf-8")
+        content = path.read_bytes()
+    except FileNotFoundError:
+        _override_cache.pop(path, None)
+        return {}
     except OSError as exc:  # pragma: no cover - defensive
         logger.warning("Failed to read backend override config: %s", exc)
         return {}
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError as exc:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError as exc:
         logger.warning("Invalid backend override config JSON: %s", exc)
         return {}
     if not isinstance(data, dict):
         return {}
-    return _normalize_override_payload(data)
+    payload = _normalize_override_payload(data)
+    _override_cache[path] = (mtime_ns, payload)
+    return payload
+
+
+def _read_override_payload(base_dir: Path) -> Dict[str, Any]:
+    """Serve the mtime cache lock-free; take _override_lock only to refresh.
+
+    Dict reads/writes are atomic under the GIL, so the fast path can check
+    the cached (mtime, payload) entry without the lock.
+    """
+    path = _runtime_override_path(base_dir)
+    cached = _override_cache.get(path)
+    if cached is not None:
+        try:
+            if path.stat().st_mtime_ns == cached[0]:
+                return cached[1]
+        except FileNotFoundError:
+            pass
+    with _override_lock:
+        return _load_override_payload(base_dir)
 
 
 def _write_override_payload(path: Path, payload: Dict[str, Any]) -> None:
@@ -326,16 +418,15 @@ def _write_override_payload(path: Path, payload: Dict[str, Any]) -> None:
     temp_path: Optional[Path] = None
     try:
         with NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
+            mode="wb",
             dir=path.parent,
             prefix=f".{path.name}.",
             suffix=".tmp",
             delete=False,
         ) as handle:
             temp_path = Path(handle.name)
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
-            handle.write("\n")
+            handle.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            handle.write(b"\n")
         temp_path.replace(path)
     except Exception:
         if temp_path is not None:
@@ -347,8 +438,7 @@ def _write_override_payload(path: Path, payload: Dict[str, Any]) -> None:
 def get_backend_override() -> Dict[str, Any]:
     """Return the current backend override payload, if any."""
     base_dir = _resolve_storage_base_dir()
-    with _override_lock:
-        return dict(_load_override_payload(base_dir))
+    return dict(_read_override_payload(base_dir))
 
 
 def apply_backend_override(payload: Dict[str, Any]) -> Settings:
@@ -362,6 +452,7 @@ def apply_backend_override(payload: Dict[str, Any]) -> Settings:
         else:
             with contextlib.suppress(FileNotFoundError):
                 path.unlink()
+        _override_cache.pop(path, None)
     get_settings.cache_clear()
     return get_settings()
 
@@ -373,6 +464,7 @@ def clear_backend_override() -> Settings:
         path = _runtime_override_path(base_dir)
         with contextlib.suppress(FileNotFoundError):
             path.unlink()
+        _override_cache.pop(path, None)
     get_settings.cache_clear()
     return get_settings()
 
@@ -380,40 +472,34 @@ def clear_backend_override() -> Settings:
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Load configuration from environment variables with caching."""
-    env_data: Dict[str, str] = {}
-
-    for field_name, field_info in Settings.model_fields.items():
-        alias = field_info.alias or field_name
-        value = os.environ.get(alias)
-        if value is not None:
-            env_data[field_name] = value
-
-    base_dir_value = env_data.get("storage_base_dir") or os.environ.get(
-        "STT_STORAGE_BASE_DIR"
-    )
+    env_snapshot = os.environ.copy()
+    env_data: Dict[str, str] = {
+        field_name: env_snapshot[alias]
+        for field_name, alias, _ in _FIELD_TABLE
+        if alias in env_snapshot
+    }
+
+    base_dir_value = env_data.get("storage_base_dir")
     if base_dir_value:
         try:
             base_dir = _resolve_storage_base_dir(str(base_dir_value))
         except RuntimeError:
             base_dir = None
         if base_dir is not None:
-            with _override_lock:
-                overrides = _load_override_payload(base_dir)
+            overrides = _read_override_payload(base_dir)
             if overrides:
                 env_data.update(overrides)
 
     try:
-        return Settings(**env_data)
+        settings = Settings(**env_data)
     except ValidationError as exc:
-        missing = []
-        for name, field_info in Settings.model_fields.items():
-            is_required_attr = getattr(field_info, "is_required")
-            required = (
-                is_required_attr()
-                if callable(is_required_attr)
-                else bool(is_required_attr)
-            )
-            if required and (name not in env_data):
-                missing.append(field_info.alias or name)
+        missing = [
+            alias for name, alias in _required_aliases() if name not in env_data
+        ]
         missing_msg = f" Missing variables: {', '.join(missing)}." if missing else ""
         raise RuntimeError(f"Invalid configuration: {exc}{missing_msg}") from exc
+
+    if settings.storage_base_dir not in _STORAGE_DIR_READY:
+        settings.storage_base_dir.mkdir(parents=True, exist_ok=True)
+        _STORAGE_DIR_READY.add(settings.storage_base_dir)
+    return settings
@@ -2,24 +2,31 @@
 
 from __future__ import annotations
 
-import base64
+import atexit
 import binascii
 import asyncio
 import contextlib
+import functools
 import json
 import logging
+import logging.handlers
+import mmap
 import os
+import queue
+import random
+import re
 import secrets
+import shutil
 import sys
 import uuid
+from collections import deque
 from datetime import datetime
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 from threading import Lock
-from typing import Any, Dict, List, Literal, Optional, get_args
+from typing import Any, Dict, List, Literal, Optional, Union, get_args
 from urllib.parse import urlparse
 
-from copy import deepcopy
-
 from fastapi import (
     Depends,
     FastAPI,
@@ -34,14 +41,16 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 import grpc
+import httpx
+import orjson
 import requests
 from websockets.exceptions import (
     ConnectionClosedError,
     ConnectionClosedOK,
 )
-from google.protobuf import json_format
+from google.protobuf.internal.type_checkers import ToShortestFloat
 from pydantic import ValidationError
 
 from .config import (
@@ -179,6 +188,17 @@ logging.basicConfig(
     datefmt="%Y-%m-%d %H:%M:%S",
 )
 
+# Route log records through a queue so stream I/O happens on a background
+# thread instead of inside request handlers or the event loop.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True
+)
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 
@@ -186,13 +206,16 @@ def _log_json_debug(context: str, payload: Any) -> None:
     if not logger.isEnabledFor(logging.DEBUG):
         return
     try:
-        serialized = json.dumps(payload, ensure_ascii=False)
+        serialized = orjson.dumps(payload).decode()
     except (TypeError, ValueError):
         serialized = repr(payload)
     logger.debug("%s: %s", context, serialized)
 
 
-def _log_streaming_message(direction: str, message: Any) -> None:
+def _log_streaming_message(
+    direction: str, message: Any, payload: Optional[Dict[str, Any]] = None
+) -> None:
+    """Debug-log a streaming frame, reusing ``payload`` if already parsed."""
     if not logger.isEnabledFor(logging.DEBUG):
         return
     if isinstance(message, (bytes, bytearray)):
@@ -200,11 +223,12 @@ def _log_streaming_message(direction: str, message: Any) -> None:
             "Streaming %s binary chunk (%d bytes)", direction, len(message)
         )
         return
-    try:
-        payload = json.loads(str(message))
-    except (TypeError, ValueError):
-        logger.debug("Streaming %s text: %s", direction, message)
-        return
+    if payload is None:
+        try:
+            payload = orjson.loads(message)
+        except (TypeError, ValueError):
+            logger.debug("Streaming %s text: %s", direction, message)
+            return
 
     recognized = None
     alternatives = payload.get("alternatives")
@@ -214,12 +238,11 @@ def _log_streaming_message(direction: str, message: Any) -> None:
             recognized = first.get("text")
 
     logger.debug(
-        "Streaming %s payload final=%s stable=%s text=%s payload=%s",
+        "Streaming %s payload final=%s stable=%s text=%s",
         direction,
         payload.get("final"),
         payload.get("stable"),
         recognized,
-        payload,
     )
 
 
@@ -259,23 +282,27 @@ def _normalize_backend_api_base_url(value: str) -> str:
 class _SuppressDocsAccessFilter(logging.Filter):
     """Filter out access logs for documentation endpoints used by health probes."""
 
-    _SUPPRESSED_FRAGMENTS = (
-        "/docs",
-        "/openapi.json",
-        "/redoc",
-        "/v1/health",
-        "/v1/backend/state",
+    _SUPPRESSED_PATTERN = re.compile(
+        r"/(?:docs|openapi\.json|redoc|v1/health|v1/backend/state)"
     )
 
     def filter(self, record: logging.LogRecord) -> bool:
-        message = record.getMessage()
-        return not any(fragment in message for fragment in self._SUPPRESSED_FRAGMENTS)
+        # uvicorn.access records carry the request path as args[2]; match on
+        # it directly so getMessage()'s %-formatting only runs as a fallback.
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3 and isinstance(args[2], str):
+            return self._SUPPRESSED_PATTERN.search(args[2]) is None
+        return self._SUPPRESSED_PATTERN.search(record.getMessage()) is None
 
 
 logging.getLogger("uvicorn.access").addFilter(_SuppressDocsAccessFilter())
 
 
-app = FastAPI(title="RTZR STT Delegation API", version="0.1.0")
+app = FastAPI(
+    title="RTZR STT Delegation API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+)
 
 
 def _configure_public_cors(app_instance: FastAPI, settings: Settings) -> None:
@@ -303,10 +330,14 @@ except RuntimeError:
 app.include_router(google_drive_oauth_router)
 
 _client: Optional[RTZRClient] = None
-_client_lock = Lock()
+
+_collector_client: Optional[httpx.AsyncClient] = None
+_collector_queue: Optional["asyncio.Queue[tuple[Settings, str, str]]"] = None
+_collector_worker_task: Optional["asyncio.Task[None]"] = None
 
 _config_cache: Optional[Dict[str, Any]] = None
 _config_cache_path: Optional[Path] = None
+_config_cache_mtime_ns: Optional[int] = None
 _config_lock = Lock()
 _transcribe_queue_lock = Lock()
 _transcribe_queue_semaphore: Optional[asyncio.Semaphore] = None
@@ -2102,20 +2133,43 @@ async def get_backend_capabilities(
 
 
 def _get_client(settings: Settings) -> RTZRClient:
-    """Singleton accessor for the RTZR client."""
+    """Singleton accessor for the RTZR client.
+
+    Only ever called from the event loop thread, so a plain null check is
+    enough; construction is idempotent and needs no lock.
+    """
     global _client
     if _client is None:
-        with _client_lock:
-            if _client is None:
-                logger.info("Initializing RTZR REST client.")
-                _client = RTZRClient(settings)
+        logger.info("Initializing RTZR REST client.")
+        _client = RTZRClient(settings)
     return _client
 
 
 def _reset_client() -> None:
     """Reset the cached RTZR client to apply new settings."""
     global _client
-    with _client_lock:
+    _client = None
+
+
+@app.on_event("startup")
+async def _warm_rtzr_client() -> None:
+    """Construct the RTZR client eagerly so the first request skips it."""
+    try:
+        settings = get_settings()
+    except RuntimeError:
+        # Configuration errors surface per-request via _ensure_settings.
+        return
+    _get_client(settings)
+    with contextlib.suppress(RuntimeError):
+        await asyncio.to_thread(_get_base_config, settings)
+
+
+@app.on_event("shutdown")
+async def _close_rtzr_client() -> None:
+    global _client
+    if _client is not None:
+        with contextlib.suppress(Exception):
+            await _client.aclose()
         _client = None
 
 
@@ -2147,35 +2201,7 @@ def _append_text_candidate(texts: List[str], candidate: Any) -> None:
 
 def _collect_from_result_entry(texts: List[str], entry: Any) -> None:
     """Extract recognized text fragments from diverse result shapes."""
-    if isinstance(entry, list):
-        for item in entry:
-            _collect_from_result_entry(texts, item)
-        return
-
-    if not isinstance(entry, dict):
-        return
-
-    # Common RTZR batch result shape.
-    _append_text_candidate(texts, entry.get("msg"))
-    _append_text_candidate(texts, entry.get("text"))
-
-    # StreamingRecognitionResult-style payloads include alternatives[].
-    alternatives = entry.get("alternatives")
-    if isinstance(alternatives, list):
-        for alternative in alternatives:
-            if isinstance(alternative, dict):
-                _append_text_candidate(texts, alternative.get("text"))
-
-    # Nested utterances field (batch responses).
-    utterances = entry.get("utterances")
-    if isinstance(utterances, list):
-        for utterance in utterances:
-            _collect_from_result_entry(texts, utterance)
-
-    # Some responses embed results recursively.
-    nested_results = entry.get("results")
-    if nested_results is not None:
-        _collect_from_result_entry(texts, nested_results)
+    _walk_result_entry(entry, texts=texts, segments=None)
 
 
 def _collect_text_candidates(result: Dict[str, Any]) -> List[str]:
@@ -2199,65 +2225,113 @@ def _coerce_millis(value: Any) -> Optional[int]:
         return None
 
 
-def _extract_segments_from_entry(
-    segments: List[Dict[str, Any]], entry: Any
-) -> None:
-    """Populate normalized segments from upstream response fragments."""
-    if isinstance(entry, list):
-        for item in entry:
-            _extract_segments_from_entry(segments, item)
-        return
+_START_KEYS = ("start_at", "start_ms", "start")
+_END_KEYS = ("end_at", "end_ms", "end")
+_SPEAKER_KEYS = ("spk", "speaker", "speaker_label")
 
-    if not isinstance(entry, dict):
-        return
 
-    nested_candidates = [
-        entry.get("utterances"),
-        entry.get("results"),
-    ]
+def _first_millis(entry: Dict[str, Any], keys: tuple) -> Optional[int]:
+    """Return the first key in ``keys`` that coerces to milliseconds."""
+    for key in keys:
+        value = _coerce_millis(entry.get(key))
+        if value is not None:
+            return value
+    return None
 
-    text = entry.get("msg") or entry.get("text")
-    if not text:
-        alternatives = entry.get("alternatives")
-        if isinstance(alternatives, list):
-            for alternative in alternatives:
-                if isinstance(alternative, dict):
-                    alt_text = alternative.get("text")
-                    if alt_text:
-                        text = alt_text
-                        break
 
-    start_ms = (
-        _coerce_millis(entry.get("start_at"))
-        or _coerce_millis(entry.get("start_ms"))
-        or _coerce_millis(entry.get("start"))
-    )
-    end_ms = (
-        _coerce_millis(entry.get("end_at"))
-        or _coerce_millis(entry.get("end_ms"))
-        or _coerce_millis(entry.get("end"))
-    )
-    duration_ms = _coerce_millis(entry.get("duration"))
-    if end_ms is None and start_ms is not None and duration_ms is not None:
-        end_ms = start_ms + duration_ms
+def _first_truthy(entry: Dict[str, Any], keys: tuple) -> Any:
+    """Return the first truthy value among ``keys``, or None."""
+    for key in keys:
+        value = entry.get(key)
+        if value:
+            return value
+    return None
 
-    if text:
-        segments.append(
-            {
-                "speaker": (
-                    entry.get("spk")
-                    or entry.get("speaker")
-                    or entry.get("speaker_label")
-                ),
-                "startMs": start_ms or 0,
-                "endMs": end_ms or (start_ms or 0),
-                "text": text.strip(),
-            }
-        )
 
-    for candidate in nested_candidates:
-        if candidate is not None:
-            _extract_segments_from_entry(segments, candidate)
+def _walk_result_entry(
+    entry: Any,
+    *,
+    texts: Optional[List[str]],
+    segments: Optional[List[Dict[str, Any]]],
+) -> None:
+    """Single traversal emitting text fragments and/or normalized segments.
+
+    Sharing one walk lets callers that need both outputs pay for the
+    msg/text/alternatives lookups once per node instead of twice.
+    """
+    append_candidate = _append_text_candidate
+    coerce_millis = _coerce_millis
+    first_millis = _first_millis
+    first_truthy = _first_truthy
+    segments_append = segments.append if segments is not None else None
+    stack = deque([entry])
+    stack_pop = stack.pop
+    stack_append = stack.append
+    stack_extend = stack.extend
+    while stack:
+        current = stack_pop()
+        current_type = type(current)
+        if current_type is list:
+            stack_extend(reversed(current))
+            continue
+        if current_type is not dict:
+            continue
+
+        # Common RTZR batch result shape, plus StreamingRecognitionResult
+        # payloads that carry alternatives[].
+        msg = current.get("msg")
+        text_field = current.get("text")
+        alternatives = current.get("alternatives")
+
+        if texts is not None:
+            append_candidate(texts, msg)
+            append_candidate(texts, text_field)
+            if type(alternatives) is list:
+                for alternative in alternatives:
+                    if type(alternative) is dict:
+                        append_candidate(texts, alternative.get("text"))
+
+        if segments is not None:
+            text = msg or text_field
+            if not text and type(alternatives) is list:
+                for alternative in alternatives:
+                    if type(alternative) is dict:
+                        alt_text = alternative.get("text")
+                        if alt_text:
+                            text = alt_text
+                            break
+
+            start_ms = first_millis(current, _START_KEYS)
+            end_ms = first_millis(current, _END_KEYS)
+            duration_ms = coerce_millis(current.get("duration"))
+            if end_ms is None and start_ms is not None and duration_ms is not None:
+                end_ms = start_ms + duration_ms
+
+            if text:
+                segments_append(
+                    {
+                        "speaker": first_truthy(current, _SPEAKER_KEYS),
+                        "startMs": start_ms or 0,
+                        "endMs": end_ms or (start_ms or 0),
+                        "text": text.strip(),
+                    }
+                )
+
+        # LIFO pop order: utterances first, nested results afterwards,
+        # matching the original recursive ordering.
+        nested_results = current.get("results")
+        if nested_results is not None:
+            stack_append(nested_results)
+        utterances = current.get("utterances")
+        if utterances is not None:
+            stack_append(utterances)
+
+
+def _extract_segments_from_entry(
+    segments: List[Dict[str, Any]], entry: Any
+) -> None:
+    """Populate normalized segments from upstream response fragments."""
+    _walk_result_entry(entry, texts=None, segments=segments)
 
 
 def _extract_segments(result: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -2269,32 +2343,51 @@ def _extract_segments(result: Dict[str, Any]) -> List[Dict[str, Any]]:
     return segments
 
 
-def _file_transcription_dir(settings: Settings) -> Path:
-    target = settings.storage_base_dir / _FILE_TRANSCRIBE_DIRNAME
+@functools.lru_cache(maxsize=32)
+def _file_transcription_dir_cached(base_dir: Path) -> Path:
+    target = base_dir / _FILE_TRANSCRIBE_DIRNAME
     target.mkdir(parents=True, exist_ok=True)
     return target
 
 
+def _file_transcription_dir(settings: Settings) -> Path:
+    return _file_transcription_dir_cached(settings.storage_base_dir)
+
+
+@functools.lru_cache(maxsize=4096)
+def _audio_artifacts_cached(base_dir: Path, transcribe_id: str) -> Dict[str, Path]:
+    return {
+        "data": base_dir / f"{transcribe_id}.bin",
+        "meta": base_dir / f"{transcribe_id}.json",
+    }
+
+
 def _audio_artifacts(settings: Settings, transcribe_id: str) -> Dict[str, Path]:
-    base_dir = _file_transcription_dir(settings)
-    data_path = base_dir / f"{transcribe_id}.bin"
-    meta_path = base_dir / f"{transcribe_id}.json"
-    return {"data": data_path, "meta": meta_path}
+    """Return the cached artifact paths for a job; callers must not mutate."""
+    return _audio_artifacts_cached(_file_transcription_dir(settings), transcribe_id)
+
+
+def _spool_upload_to_disk(settings: Settings, upload: UploadFile) -> Path:
+    """Stream the upload into the transcription dir in 64KB chunks."""
+    spool_dir = _file_transcription_dir(settings)
+    with NamedTemporaryFile(
+        dir=spool_dir, prefix=".upload-", suffix=".part", delete=False
+    ) as handle:
+        shutil.copyfileobj(upload.file, handle, 65536)
+        return Path(handle.name)
 
 
 def _persist_uploaded_audio(
-    settings: Settings, transcribe_id: str, upload: UploadFile, data: bytes
+    settings: Settings, transcribe_id: str, upload: UploadFile, spool_path: Path
 ) -> Optional[Path]:
-    if not data:
-        return None
     artifacts = _audio_artifacts(settings, transcribe_id)
     try:
-        artifacts["data"].write_bytes(data)
+        spool_path.replace(artifacts["data"])
         metadata = {
             "content_type": (upload.content_type or "application/octet-stream"),
             "original_filename": upload.filename or f"{transcribe_id}.wav",
         }
-        artifacts["meta"].write_text(json.dumps(metadata, ensure_ascii=False), encoding="utf-8")
+        artifacts["meta"].write_bytes(orjson.dumps(metadata))
     except OSError as exc:  # pragma: no cover - storage failure
         for path in artifacts.values():
             with contextlib.suppress(FileNotFoundError):
@@ -2304,15 +2397,18 @@ def _persist_uploaded_audio(
     return artifacts["data"]
 
 
-def _load_audio_metadata(meta_path: Path) -> Dict[str, str]:
+@functools.lru_cache(maxsize=1024)
+def _load_audio_metadata_cached(
+    meta_path: Path, mtime_ns: Optional[int]
+) -> Dict[str, str]:
     default = {
         "content_type": "application/octet-stream",
         "original_filename": meta_path.stem or "audio.wav",
     }
-    if not meta_path.exists():
+    if mtime_ns is None:
         return default
     try:
-        payload = json.loads(meta_path.read_text(encoding="utf-8"))
+        payload = orjson.loads(meta_path.read_bytes())
         if not isinstance(payload, dict):
             return default
         return {
@@ -2321,10 +2417,19 @@ def _load_audio_metadata(meta_path: Path) -> Dict[str, str]:
                 payload.get("original_filename") or f"{meta_path.stem}.wav"
             ),
         }
-    except (OSError, json.JSONDecodeError):
+    except (OSError, orjson.JSONDecodeError):
         return default
 
 
+def _load_audio_metadata(meta_path: Path) -> Dict[str, str]:
+    """Read persisted audio metadata, cached per (path, mtime)."""
+    try:
+        mtime_ns = os.stat(meta_path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _load_audio_metadata_cached(meta_path, mtime_ns)
+
+
 def _build_audio_url(transcribe_id: str) -> str:
     return f"/v1/transcribe/{transcribe_id}/audio"
 
@@ -2344,30 +2449,57 @@ def _build_failure_response(message: str) -> STTResponse:
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _failure_response_bytes(message: str) -> bytes:
+    """Serialize the failure envelope for ``message`` once and reuse it."""
+    payload = STTResponse(
+        result=FAILURE_CODE, return_object=STTReturnObject(recognized=message)
+    )
+    return orjson.dumps(payload.model_dump())
+
+
+def _static_failure_response(message: str) -> Response:
+    """Failure response for a fixed message.
+
+    Skips per-request model construction and response encoding; only call
+    with literal messages so the backing cache stays bounded. Dynamic
+    messages go through :func:`_build_failure_response`.
+    """
+    logger.error("Delegation API failure: %s", message)
+    return Response(
+        content=_failure_response_bytes(message), media_type="application/json"
+    )
+
+
 async def _poll_until_complete(
     client: RTZRClient, transcribe_id: str, settings: Settings
 ) -> Optional[Dict[str, Any]]:
-    """Poll the RTZR API until completion, failure, or timeout."""
-    deadline = asyncio.get_running_loop().time() + settings.poll_timeout_seconds
+    """Poll the RTZR API until completion, failure, or timeout.
+
+    Starts with a short delay and backs off exponentially, so fast jobs
+    are not penalized a full interval while long jobs settle at a cadence
+    of up to four configured intervals between checks. A small random
+    jitter is added to each sleep so concurrent jobs submitted together
+    do not poll the upstream in synchronized waves.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.poll_timeout_seconds
+    max_delay = settings.poll_interval_seconds * 4
+    delay = min(0.05, max_delay)
 
     while True:
         result: Dict[str, Any] = await client.get_transcription(transcribe_id)
         status = result.get("status")
         if status in {"completed", "failed"}:
             return result
-        if asyncio.get_running_loop().time() > deadline:
+        if loop.time() > deadline:
             return None
-        await asyncio.sleep(settings.poll_interval_seconds)
-
+        await asyncio.sleep(delay + random.uniform(0.0, delay * 0.1))
+        delay = min(delay * 1.5, max_delay)
 
-def _write_json_dump(target: Path, data: Dict[str, Any]) -> None:
-    """Persist JSON response data."""
-    target.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
 
-
-def _ensure_storage_dirs(base_dir: Path, timestamp: datetime) -> Dict[str, Path]:
-    """Prepare dated storage directories for audio and transcription logs."""
-    date_path = timestamp.strftime("%Y/%m/%d")
+@functools.lru_cache(maxsize=8)
+def _ensure_storage_dirs_cached(base_dir: Path, date_path: str) -> Dict[str, Path]:
     audio_dir = base_dir / date_path / "audio_raw"
     transcript_dir = base_dir / date_path / "txt_stt"
     audio_dir.mkdir(parents=True, exist_ok=True)
@@ -2375,26 +2507,54 @@ def _ensure_storage_dirs(base_dir: Path, timestamp: datetime) -> Dict[str, Path]
     return {"audio": audio_dir, "transcript": transcript_dir}
 
 
+def _ensure_storage_dirs(base_dir: Path, timestamp: datetime) -> Dict[str, Path]:
+    """Prepare dated storage directories for audio and transcription logs.
+
+    Cached per (base dir, date) so the mkdir syscalls run once a day, not
+    once per request.
+    """
+    date_path = f"{timestamp.year:04d}/{timestamp.month:02d}/{timestamp.day:02d}"
+    return _ensure_storage_dirs_cached(base_dir, date_path)
+
+
 def _get_base_config(settings: Settings) -> Dict[str, Any]:
-    """Load and cache the STT configuration if a JSON file is provided."""
+    """Load and cache the STT configuration if a JSON file is provided.
+
+    The cache is keyed on the file's mtime, so edits are picked up without
+    a restart. Returns the shared cached dict; callers must treat it as
+    read-only and layer request-specific keys via a new dict
+    (e.g. ``{**base, ...}``).
+    """
     if not settings.has_stt_config:
         return {}
 
-    global _config_cache, _config_cache_path
+    global _config_cache, _config_cache_path, _config_cache_mtime_ns
     assert settings.stt_config_path is not None
     config_path = settings.stt_config_path
 
-    if _config_cache is None or _config_cache_path != config_path:
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError as exc:  # pragma: no cover - defensive guard
+        raise RuntimeError(f"STT config file not found: {config_path}") from exc
+
+    if (
+        _config_cache is None
+        or _config_cache_path != config_path
+        or _config_cache_mtime_ns != mtime_ns
+    ):
         with _config_lock:
-            if _config_cache is None or _config_cache_path != config_path:
+            if (
+                _config_cache is None
+                or _config_cache_path != config_path
+                or _config_cache_mtime_ns != mtime_ns
+            ):
                 try:
-                    with config_path.open("r", encoding="utf-8") as fp:
-                        data = json.load(fp)
+                    data = orjson.loads(config_path.read_bytes())
                 except FileNotFoundError as exc:  # pragma: no cover - defensive guard
                     raise RuntimeError(
                         f"STT config file not found: {config_path}"
                     ) from exc
-                except json.JSONDecodeError as exc:
+                except orjson.JSONDecodeError as exc:
                     raise RuntimeError(
                         f"Invalid JSON in STT config file ({config_path}): {exc}"
                     ) from exc
@@ -2406,29 +2566,90 @@ def _get_base_config(settings: Settings) -> Dict[str, Any]:
 
                 _config_cache = data
                 _config_cache_path = config_path
+                _config_cache_mtime_ns = mtime_ns
 
     assert _config_cache is not None
-    return deepcopy(_config_cache)
+    return _config_cache
+
+
+def _get_collector_client(settings: Settings) -> httpx.AsyncClient:
+    """Singleton accessor for the async collector HTTP client."""
+    global _collector_client
+    if _collector_client is None:
+        _collector_client = httpx.AsyncClient(
+            timeout=settings.collector_timeout_seconds,
+            verify=settings.verify_ssl,
+        )
+    return _collector_client
+
+
+async def _collector_worker() -> None:
+    """Drain queued collector notifications without blocking request handlers."""
+    assert _collector_queue is not None
+    while True:
+        settings, log_id, data_json = await _collector_queue.get()
+        try:
+            ok = await _post_to_collector(settings, log_id, data_json)
+            if not ok:
+                logger.warning(
+                    "Collector notification failed for %s; STT result was already returned.",
+                    log_id,
+                )
+        except Exception:  # pragma: no cover - defensive
+            logger.exception("Collector worker error for %s", log_id)
+        finally:
+            _collector_queue.task_done()
+
+
+def _enqueue_collector_post(settings: Settings, log_id: str, data_json: str) -> None:
+    """Queue a collector notification; drops with a warning when saturated."""
+    global _collector_queue, _collector_worker_task
+    if _collector_queue is None:
+        _collector_queue = asyncio.Queue(maxsize=256)
+        _collector_worker_task = asyncio.create_task(_collector_worker())
+    try:
+        _collector_queue.put_nowait((settings, log_id, data_json))
+    except asyncio.QueueFull:
+        logger.warning("Collector queue full; dropping notification for %s", log_id)
+
+
+@app.on_event("shutdown")
+async def _stop_collector_worker() -> None:
+    global _collector_worker_task
+    if _collector_worker_task is not None:
+        if _collector_queue is not None and not _collector_queue.empty():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(_collector_queue.join(), timeout=5)
+        _collector_worker_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _collector_worker_task
+        _collector_worker_task = None
 
 
-def _post_to_collector(settings: Settings, log_id: str, data_json: str) -> bool:
+@app.on_event("shutdown")
+async def _close_collector_client() -> None:
+    global _collector_client
+    if _collector_client is not None:
+        await _collector_client.aclose()
+        _collector_client = None
+
+
+async def _post_to_collector(settings: Settings, log_id: str, data_json: str) -> bool:
     """Send transcription payload to the configured collector endpoint."""
     if not settings.collector_enabled:
         return True
 
     collector_url = f"{settings.collector_url}/collector/v1/stt-result"
     headers = {"Content-Type": "application/json"}
-    payload = {"id": log_id, "data": data_json}
+    body = orjson.dumps({"id": log_id, "data": data_json})
 
     try:
-        response = requests.post(
+        response = await _get_collector_client(settings).post(
             collector_url,
-            json=payload,
+            content=body,
             headers=headers,
-            timeout=settings.collector_timeout_seconds,
-            verify=settings.verify_ssl,
         )
-    except requests.RequestException as exc:
+    except httpx.HTTPError as exc:
         logger.error("Collector request failed: %s", exc)
         return False
 
@@ -2509,15 +2730,11 @@ async def proxy_transcribe(
     settings = _ensure_settings()
     client = _get_client(settings)
 
-    file_bytes = await file.read()
-    if not file_bytes:
-        _raise_api_error(400, "FILE_EMPTY", "Uploaded file is empty.")
-
     config_text = (config or "").strip()
     if config_text:
         try:
-            config_payload = json.loads(config_text)
-        except json.JSONDecodeError as exc:
+            config_payload = orjson.loads(config_text)
+        except orjson.JSONDecodeError as exc:
             _raise_api_error(
                 400,
                 "INVALID_CONFIG_JSON",
@@ -2531,33 +2748,58 @@ async def proxy_transcribe(
     else:
         config_payload = {}
 
+    spool_path = await asyncio.to_thread(_spool_upload_to_disk, settings, file)
+    if not spool_path.stat().st_size:
+        await asyncio.to_thread(spool_path.unlink)
+        _raise_api_error(400, "FILE_EMPTY", "Uploaded file is empty.")
+
+    spool_handle = spool_path.open("rb")
+    file_view = mmap.mmap(spool_handle.fileno(), 0, access=mmap.ACCESS_READ)
+    persisted = False
     try:
-        upstream_response = await _submit_transcription_queued(
-            client,
-            settings,
-            file_bytes,
-            config_payload,
-            title,
-        )
-    except HTTPException:
-        raise
-    except Exception as exc:  # pragma: no cover - upstream failure
-        logger.exception("파일 전사 프록시 중 오류", exc_info=exc)
-        _raise_api_error(
-            502,
-            "UPSTREAM_REQUEST_FAILED",
-            "Upstream transcription request failed.",
-            {"reason": str(exc)},
-        )
+        try:
+            upstream_response = await _submit_transcription_queued(
+                client,
+                settings,
+                file_view,
+                config_payload,
+                title,
+            )
+        except HTTPException:
+            raise
+        except Exception as exc:  # pragma: no cover - upstream failure
+            logger.exception("파일 전사 프록시 중 오류", exc_info=exc)
+            _raise_api_error(
+                502,
+                "UPSTREAM_REQUEST_FAILED",
+                "Upstream transcription request failed.",
+                {"reason": str(exc)},
+            )
 
-    upstream_response.setdefault("created_at", datetime.utcnow().isoformat())
-    transcribe_id = upstream_response.get("transcribe_id") or upstream_response.get("id")
-    if transcribe_id:
-        audio_path = _persist_uploaded_audio(settings, transcribe_id, file, file_bytes)
-        if audio_path:
-            upstream_response.setdefault("audio_url", _build_audio_url(transcribe_id))
+        # Guarded assignment instead of setdefault: skip building the
+        # timestamp string when upstream already supplied one.
+        if "created_at" not in upstream_response:
+            upstream_response["created_at"] = datetime.utcnow().isoformat()
+        transcribe_id = upstream_response.get("transcribe_id") or upstream_response.get(
+            "id"
+        )
+        if transcribe_id:
+            audio_path = await asyncio.to_thread(
+                _persist_uploaded_audio, settings, transcribe_id, file, spool_path
+            )
+            if audio_path:
+                persisted = True
+                upstream_response.setdefault(
+                    "audio_url", _build_audio_url(transcribe_id)
+                )
 
-    return upstream_response
+        return upstream_response
+    finally:
+        file_view.close()
+        spool_handle.close()
+        if not persisted:
+            with contextlib.suppress(FileNotFoundError):
+                await asyncio.to_thread(spool_path.unlink)
 
 
 @app.get("/v1/transcribe/{transcribe_id}")
@@ -2582,7 +2824,9 @@ async def proxy_transcription_status(transcribe_id: str):
     if segments:
         status_payload["segments"] = segments
         if not status_payload.get("text"):
-            status_payload["text"] = " ".join(segment["text"] for segment in segments if segment.get("text"))
+            status_payload["text"] = " ".join(
+                [segment["text"] for segment in segments if segment.get("text")]
+            )
     audio_url = _available_audio_url(settings, transcribe_id)
     if audio_url:
         status_payload.setdefault("audio_url", audio_url)
@@ -2597,20 +2841,71 @@ async def proxy_transcription_status(transcribe_id: str):
 async def download_transcription_audio(transcribe_id: str):
     settings = _ensure_settings()
     artifacts = _audio_artifacts(settings, transcribe_id)
-    if not artifacts["data"].exists():
+    try:
+        stat_result = os.stat(artifacts["data"])
+    except OSError:
         _raise_api_error(404, "AUDIO_NOT_FOUND", "Audio is not available.")
     metadata = _load_audio_metadata(artifacts["meta"])
     return FileResponse(
         path=artifacts["data"],
         media_type=metadata["content_type"],
         filename=metadata["original_filename"],
+        stat_result=stat_result,
     )
 
 
+# Coalescing bounds for upstream audio writes: flush once this much audio
+# has buffered, or when no further frame arrives within the idle window.
+_AUDIO_COALESCE_BYTES = 8192
+_AUDIO_COALESCE_IDLE_SECONDS = 0.005
+
+
+def _error_frame(message: str) -> str:
+    return orjson.dumps({"type": "error", "message": message}).decode()
+
+
+_READY_FRAME = orjson.dumps({"type": "ready"}).decode()
+_ERR_MISSING_START_FRAME = _error_frame("Missing start message.")
+_ERR_INVALID_START_FRAME = _error_frame("Invalid start payload.")
+_ERR_START_REQUIRED_FRAME = _error_frame("Start message is required first.")
+_ERR_GRPC_CONNECT_FRAME = _error_frame(
+    "Failed to connect upstream gRPC streaming session."
+)
+_ERR_UPSTREAM_CONNECT_FRAME = _error_frame(
+    "Failed to connect upstream streaming session."
+)
+
+
+_MESSAGE_TYPE_KEYS = ("type", "event", "state", "event_type")
+# Session-setup/keepalive types the relays swallow, and the types that
+# request finalization. Hoisted so every relay loop shares one table.
+_START_MESSAGE_TYPES = frozenset({"start", "session", "start_request"})
+_CONTROL_MESSAGE_TYPES = _START_MESSAGE_TYPES | {"ping", "pong"}
+_FINALIZE_MESSAGE_TYPES = frozenset({"final", "stop", "eos"})
+_KNOWN_MESSAGE_TYPES = frozenset(
+    sys.intern(value)
+    for value in (
+        "start",
+        "session",
+        "start_request",
+        "ping",
+        "pong",
+        "final",
+        "stop",
+        "eos",
+    )
+)
+
+
 def _normalize_message_type(payload: Dict[str, Any]) -> str:
-    for key in ("type", "event", "state", "event_type"):
-        value = payload.get(key)
-        if isinstance(value, str):
+    get = payload.get
+    for key in _MESSAGE_TYPE_KEYS:
+        value = get(key)
+        if type(value) is str:
+            # Well-formed clients send the canonical lowercase types; skip
+            # the strip/lower allocations for them.
+            if value in _KNOWN_MESSAGE_TYPES:
+                return value
             stripped = value.strip()
             if stripped:
                 return stripped.lower()
@@ -2647,47 +2942,43 @@ async def _receive_stream_start_payload(
 
     start_text = first.get("text")
     if not start_text:
-        await websocket.send_text(
-            json.dumps({"type": "error", "message": "Missing start message."})
-        )
+        await websocket.send_text(_ERR_MISSING_START_FRAME)
         await websocket.close(code=1007, reason="Missing start message")
         return None
 
     try:
-        start_payload = json.loads(start_text)
-    except json.JSONDecodeError:
-        await websocket.send_text(
-            json.dumps({"type": "error", "message": "Invalid start payload."})
-        )
+        start_payload = orjson.loads(start_text)
+    except orjson.JSONDecodeError:
+        await websocket.send_text(_ERR_INVALID_START_FRAME)
         await websocket.close(code=1007, reason="Invalid start payload")
         return None
 
     if not isinstance(start_payload, dict):
-        await websocket.send_text(
-            json.dumps({"type": "error", "message": "Invalid start payload."})
-        )
+        await websocket.send_text(_ERR_INVALID_START_FRAME)
         await websocket.close(code=1007, reason="Invalid start payload")
         return None
 
     msg_type = _normalize_message_type(start_payload)
-    if msg_type and msg_type not in {"start", "session", "start_request"}:
-        await websocket.send_text(
-            json.dumps(
-                {"type": "error", "message": "Start message is required first."}
-            )
-        )
+    if msg_type and msg_type not in _START_MESSAGE_TYPES:
+        await websocket.send_text(_ERR_START_REQUIRED_FRAME)
         await websocket.close(code=1007, reason="Start message required")
         return None
 
     return start_payload
 
 
+_SPEECH_EVENT_NAMES = {
+    value.number: value.name
+    for value in stt_pb2.DecoderResponse.SpeechEventType.DESCRIPTOR.values
+}
+
+
 def _speech_event_name(event_value: int) -> str:
-    try:
-        return stt_pb2.DecoderResponse.SpeechEventType.Name(event_value)
-    except ValueError:
+    name = _SPEECH_EVENT_NAMES.get(event_value)
+    if name is None:
         logger.debug("Unknown gRPC speech event type: %s", event_value)
         return f"UNKNOWN_{event_value}"
+    return name
 
 
 def _infer_result_flags(payload: Dict[str, Any]) -> tuple[Optional[bool], Optional[str]]:
@@ -2755,10 +3046,61 @@ def _extract_words_from_results(results: list[Any]) -> list[str]:
     return words_text_fragments
 
 
+def _decoder_response_to_dict(message: stt_pb2.DecoderResponse) -> Dict[str, Any]:
+    """Project a DecoderResponse into the MessageToDict-compatible shape.
+
+    json_format.MessageToDict re-walks field descriptors on every frame;
+    the proto is small enough to read directly. Field presence rules and
+    the stringified int64 word offsets match MessageToDict output.
+    """
+    payload: Dict[str, Any] = {}
+    results_payload: List[Dict[str, Any]] = []
+    for result in message.results:
+        entry: Dict[str, Any] = {}
+        alternatives_payload: List[Dict[str, Any]] = []
+        for alternative in result.alternatives:
+            alt_entry: Dict[str, Any] = {}
+            if alternative.text:
+                alt_entry["text"] = alternative.text
+            if alternative.confidence:
+                alt_entry["confidence"] = ToShortestFloat(alternative.confidence)
+            if alternative.words:
+                words_payload: List[Dict[str, Any]] = []
+                for word in alternative.words:
+                    word_entry: Dict[str, Any] = {}
+                    if word.start_at:
+                        word_entry["start_at"] = str(word.start_at)
+                    if word.duration:
+                        word_entry["duration"] = str(word.duration)
+                    if word.text:
+                        word_entry["text"] = word.text
+                    if word.confidence:
+                        word_entry["confidence"] = ToShortestFloat(word.confidence)
+                    words_payload.append(word_entry)
+                alt_entry["words"] = words_payload
+            alternatives_payload.append(alt_entry)
+        if alternatives_payload:
+            entry["alternatives"] = alternatives_payload
+        if result.is_final:
+            entry["is_final"] = True
+        if result.stability:
+            entry["stability"] = ToShortestFloat(result.stability)
+        if result.duration:
+            entry["duration"] = result.duration
+        if result.start_at:
+            entry["start_at"] = result.start_at
+        if result.seq:
+            entry["seq"] = result.seq
+        results_payload.append(entry)
+    if results_payload:
+        payload["results"] = results_payload
+    if message.speech_event_type:
+        payload["speech_event_type"] = _speech_event_name(message.speech_event_type)
+    return payload
+
+
 def _grpc_response_payload(message: stt_pb2.DecoderResponse) -> Dict[str, Any]:
-    payload = json_format.MessageToDict(
-        message, preserving_proto_field_name=True
-    )
+    payload = _decoder_response_to_dict(message)
     event_name = _speech_event_name(message.speech_event_type)
     payload.setdefault("event_type", event_name)
 
@@ -2835,7 +3177,7 @@ async def _handle_onprem_streaming(
         )
         if isinstance(exc, grpc.RpcError):
             await websocket.send_text(
-                json.dumps(_grpc_terminal_error_payload(exc), ensure_ascii=False)
+                orjson.dumps(_grpc_terminal_error_payload(exc)).decode()
             )
             await websocket.close(
                 code=UPSTREAM_GRPC_TERMINAL_CLOSE_CODE,
@@ -2843,45 +3185,65 @@ async def _handle_onprem_streaming(
             )
         else:
             await websocket.send_text(
-                json.dumps({"type": "error", "message": "Failed to connect upstream gRPC streaming session."})
+                _ERR_GRPC_CONNECT_FRAME
             )
             await websocket.close(code=1011, reason="Upstream gRPC connection failed")
         return
 
     # Signal handshake ready to the browser client.
-    await websocket.send_text(json.dumps({"type": "ready"}))
+    await websocket.send_text(_READY_FRAME)
     websocket_close_code = 1000
     websocket_close_reason = ""
 
     async def relay_client_to_grpc():
         finalize_requested = False
+        pending = bytearray()
+
+        async def flush_pending() -> None:
+            if pending and not finalize_requested:
+                await grpc_session.send_audio(bytes(pending))
+                pending.clear()
+
         try:
             while True:
                 message = await websocket.receive()
-                if message.get("type") == "websocket.disconnect":
+                disconnected = False
+                # Coalesce back-to-back audio frames into one gRPC write;
+                # flush on size, control messages, idle, or disconnect.
+                while True:
+                    if message.get("type") == "websocket.disconnect":
+                        disconnected = True
+                        break
+                    binary = message.get("bytes")
+                    if binary is not None:
+                        if not finalize_requested:
+                            pending += binary
+                            if len(pending) >= _AUDIO_COALESCE_BYTES:
+                                await flush_pending()
+                    else:
+                        text = message.get("text")
+                        if text is not None:
+                            try:
+                                parsed = orjson.loads(text)
+                            except orjson.JSONDecodeError:
+                                parsed = None
+                            if isinstance(parsed, dict):
+                                parsed_type = _normalize_message_type(parsed)
+                                if parsed_type in _FINALIZE_MESSAGE_TYPES and (
+                                    not finalize_requested
+                                ):
+                                    await flush_pending()
+                                    await grpc_session.finish()
+                                    finalize_requested = True
+                    try:
+                        message = await asyncio.wait_for(
+                            websocket.receive(), _AUDIO_COALESCE_IDLE_SECONDS
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                await flush_pending()
+                if disconnected:
                     break
-                binary = message.get("bytes")
-                if binary is not None:
-                    if not finalize_requested:
-                        await grpc_session.send_audio(bytes(binary))
-                    continue
-                text = message.get("text")
-                if text is None:
-                    continue
-                try:
-                    parsed = json.loads(text)
-                except json.JSONDecodeError:
-                    continue
-                if not isinstance(parsed, dict):
-                    continue
-                parsed_type = _normalize_message_type(parsed)
-                if parsed_type in {"final", "stop", "eos"}:
-                    if not finalize_requested:
-                        await grpc_session.finish()
-                        finalize_requested = True
-                    continue
-                if parsed_type in {"ping", "pong"}:
-                    continue
         except WebSocketDisconnect:
             logger.info("온프렘 스트리밍: 브라우저 연결 종료 (client->grpc)")
         except Exception as exc:  # pragma: no cover - defensive
@@ -2896,16 +3258,15 @@ async def _handle_onprem_streaming(
                 if response is None:
                     if grpc_session.last_error:
                         await websocket.send_text(
-                            json.dumps(
-                                _grpc_terminal_error_payload(grpc_session.last_error),
-                                ensure_ascii=False,
-                            )
+                            orjson.dumps(
+                                _grpc_terminal_error_payload(grpc_session.last_error)
+                            ).decode()
                         )
                         websocket_close_code = UPSTREAM_GRPC_TERMINAL_CLOSE_CODE
                         websocket_close_reason = UPSTREAM_GRPC_TERMINAL_CLOSE_REASON
                     break
                 await websocket.send_text(
-                    json.dumps(_grpc_response_payload(response), ensure_ascii=False)
+                    orjson.dumps(_grpc_response_payload(response)).decode()
                 )
         except WebSocketDisconnect:
             logger.info("온프렘 스트리밍: 브라우저 연결 종료 (grpc->client)")
@@ -2926,10 +3287,16 @@ async def _handle_onprem_streaming(
             with contextlib.suppress(asyncio.CancelledError):
                 task.result()
     finally:
-        with contextlib.suppress(Exception):
+        try:
             await grpc_session.close()
-        with contextlib.suppress(Exception):
+        except Exception as exc:  # pragma: no cover - best-effort cleanup
+            logger.debug("온프렘 스트리밍 grpc 세션 close 무시", exc_info=exc)
+        try:
             await websocket.close(code=websocket_close_code, reason=websocket_close_reason)
+        except RuntimeError:
+            # Starlette raises if the socket already completed its close
+            # handshake; nothing left to do.
+            pass
 
 
 @app.websocket("/v1/streaming")
@@ -2938,7 +3305,7 @@ async def streaming_proxy(websocket: WebSocket):
         settings = get_settings()
     except RuntimeError as exc:
         await websocket.accept()
-        await websocket.send_text(json.dumps({"type": "error", "message": str(exc)}))
+        await websocket.send_text(_error_frame(str(exc)))
         await websocket.close(code=1011, reason="Configuration error")
         return
 
@@ -2968,47 +3335,67 @@ async def streaming_proxy(websocket: WebSocket):
             exc_info=exc,
         )
         await websocket.send_text(
-            json.dumps({"type": "error", "message": "Failed to connect upstream streaming session."})
+            _ERR_UPSTREAM_CONNECT_FRAME
         )
         await websocket.close(code=1011, reason="Upstream connection failed")
         return
 
-    await websocket.send_text(json.dumps({"type": "ready"}))
+    await websocket.send_text(_READY_FRAME)
 
     async def relay_client_to_upstream():
         finalize_requested = False
+        pending = bytearray()
+
+        async def flush_pending() -> None:
+            if pending:
+                await upstream.send(bytes(pending))
+                pending.clear()
+
         try:
             while True:
                 message = await websocket.receive()
-                if message.get("type") == "websocket.disconnect":
-                    break
-                binary = message.get("bytes")
-                if binary is not None:
-                    if not finalize_requested:
-                        await upstream.send(bytes(binary))
-                    continue
-                text = message.get("text")
-                if text is not None:
-                    try:
-                        parsed: Any = json.loads(text)
-                    except json.JSONDecodeError:
-                        parsed = text
-
-                    if isinstance(parsed, dict):
-                        parsed_type = _normalize_message_type(parsed)
-                        if parsed_type in {"start", "session", "start_request", "ping", "pong"}:
-                            continue
-                        if parsed_type in {"final", "stop", "eos"}:
-                            if not finalize_requested:
+                disconnected = False
+                # Coalesce back-to-back audio frames into one upstream write;
+                # flush on size, finalize, idle, or disconnect.
+                while True:
+                    if message.get("type") == "websocket.disconnect":
+                        disconnected = True
+                        break
+                    binary = message.get("bytes")
+                    if binary is not None:
+                        if not finalize_requested:
+                            pending += binary
+                            if len(pending) >= _AUDIO_COALESCE_BYTES:
+                                await flush_pending()
+                    else:
+                        text = message.get("text")
+                        if text is not None:
+                            try:
+                                parsed: Any = orjson.loads(text)
+                            except orjson.JSONDecodeError:
+                                parsed = text
+
+                            wants_finalize = False
+                            if isinstance(parsed, dict):
+                                parsed_type = _normalize_message_type(parsed)
+                                wants_finalize = (
+                                    parsed_type in _FINALIZE_MESSAGE_TYPES
+                                )
+                            elif isinstance(parsed, str):
+                                wants_finalize = parsed.strip().upper() == "EOS"
+                            if wants_finalize and not finalize_requested:
+                                await flush_pending()
                                 await upstream.send("EOS")
                                 finalize_requested = True
-                            continue
-                        continue
-
-                    if isinstance(parsed, str) and parsed.strip().upper() == "EOS":
-                        if not finalize_requested:
-                            await upstream.send("EOS")
-                            finalize_requested = True
+                    try:
+                        message = await asyncio.wait_for(
+                            websocket.receive(), _AUDIO_COALESCE_IDLE_SECONDS
+                        )
+                    except asyncio.TimeoutError:
+                        break
+                await flush_pending()
+                if disconnected:
+                    break
         except WebSocketDisconnect:
             pass
         except (ConnectionClosedError, ConnectionClosedOK):
@@ -3018,14 +3405,19 @@ async def streaming_proxy(websocket: WebSocket):
             raise
 
     async def relay_upstream_to_client():
+        # Bound once so production (INFO) sessions skip even the helper
+        # call on the per-frame path.
+        log_frames = logger.isEnabledFor(logging.DEBUG)
         try:
-            while True:
-                data = await upstream.recv()
-                _log_streaming_message("upstream->client", data)
-                if isinstance(data, (bytes, bytearray)):
-                    await websocket.send_bytes(bytes(data))
-                else:
+            # Async iteration lets the websockets library skip the per-recv
+            # state check and ends cleanly when upstream closes.
+            async for data in upstream:
+                if log_frames:
+                    _log_streaming_message("upstream->client", data)
+                if isinstance(data, str):
                     await websocket.send_text(data)
+                else:
+                    await websocket.send_bytes(data)
         except (ConnectionClosedOK, ConnectionClosedError):
             pass
         except WebSocketDisconnect:
@@ -3057,47 +3449,48 @@ async def streaming_proxy(websocket: WebSocket):
     finally:
         for task in forward_tasks:
             task.cancel()
-        with contextlib.suppress(Exception):
+        try:
             await upstream.close()
-        with contextlib.suppress(Exception):
+        except Exception as exc:  # pragma: no cover - best-effort cleanup
+            logger.debug("스트리밍 프록시 upstream close 무시", exc_info=exc)
+        try:
             await websocket.close()
+        except RuntimeError:
+            # Starlette raises if the socket already completed its close
+            # handshake; nothing left to do.
+            pass
 
 
-@app.post("/stt_api", response_model=STTResponse)
-async def stt_api(payload: STTRequest) -> STTResponse:
-    """Synchronous-style STT delegation endpoint."""
-    try:
-        settings = get_settings()
-    except RuntimeError as exc:
-        return _build_failure_response(str(exc))
-
-    if payload.argument.language_code.lower() != "korean":
-        return _build_failure_response("Unsupported language_code. Expected 'korean'.")
-
-    try:
-        audio_bytes = base64.b64decode(payload.argument.audio)
-    except (binascii.Error, ValueError):
-        return _build_failure_response("Invalid base64-encoded audio payload.")
-
+async def _delegate_stt(
+    settings: Settings, audio_bytes: bytes, language_code: str
+) -> Union[STTResponse, Response]:
+    """Persist audio, submit it upstream, and poll to a terminal STTResponse."""
     timestamp = datetime.now()
-    directories = _ensure_storage_dirs(settings.storage_base_dir, timestamp)
-    request_identifier = uuid.uuid4().hex[:8]
+    directories = await asyncio.to_thread(
+        _ensure_storage_dirs, settings.storage_base_dir, timestamp
+    )
 
-    audio_filename = f"{timestamp.strftime('%H%M%S_%f')}_{request_identifier}.wav"
-    audio_path = directories["audio"] / audio_filename
-    audio_path.write_bytes(audio_bytes)
+    # The artifact name only depends on the request timestamp, so compute it
+    # up front and write the audio straight into its final name instead of
+    # renaming after submission. Integer-field formatting skips the
+    # locale-aware strftime path for what is filename-only output.
+    file_timestamp = (
+        f"{timestamp.year:04d}{timestamp.month:02d}{timestamp.day:02d}"
+        f"{timestamp.hour:02d}{timestamp.minute:02d}{timestamp.second:02d}"
+        f"{timestamp.microsecond // 100:04d}"
+    )
+
+    audio_path = directories["audio"] / f"{file_timestamp}.wav"
+    await asyncio.to_thread(audio_path.write_bytes, audio_bytes)
 
     client = _get_client(settings)
 
     try:
-        config = _get_base_config(settings)
+        base_config = await asyncio.to_thread(_get_base_config, settings)
     except RuntimeError as exc:
         return _build_failure_response(str(exc))
 
-    if not config:
-        config = {}
-
-    config["language"] = payload.argument.language_code
+    config = {**base_config, "language": language_code}
 
     try:
         submission = await client.submit_transcription(audio_bytes, config, None)
@@ -3110,26 +3503,16 @@ async def stt_api(payload: STTRequest) -> STTResponse:
         or submission.get("tid")
     )
     if not transcribe_id:
-        return _build_failure_response("Upstream response did not include transcribe_id.")
-
-    now_kst = datetime.now()
-
-    # log_id = transcribe_id or request_identifier
-    base_timestamp = now_kst.strftime("%Y%m%d%H%M%S")
-    micro_4digits = now_kst.strftime("%f")[:4]
-    file_timestamp = f"{base_timestamp}{micro_4digits}"
-
-    # Rename the audio file to include the transcribe ID for traceability.
-    # new_audio_name = f"{timestamp.strftime('%H%M%S_%f')}_{transcribe_id}.wav"
-    new_audio_name = f"{file_timestamp}.wav"
-    new_audio_path = audio_path.with_name(new_audio_name)
-    audio_path.rename(new_audio_path)
-    audio_path = new_audio_path
+        return _static_failure_response(
+            "Upstream response did not include transcribe_id."
+        )
 
     poll_result = await _poll_until_complete(client, transcribe_id, settings)
 
     if poll_result is None:
-        return _build_failure_response("Transcription job timed out before completion.")
+        return _static_failure_response(
+            "Transcription job timed out before completion."
+        )
 
     text_fragments = _collect_text_candidates(poll_result)
     full_msg = " ".join(text_fragments)
@@ -3138,21 +3521,17 @@ async def stt_api(payload: STTRequest) -> STTResponse:
         results_container["full_msg"] = full_msg
     else:
         poll_result["full_msg"] = full_msg
-    poll_result_json = json.dumps(poll_result, ensure_ascii=False)
+    # Serialize once and share the bytes between the transcript dump and
+    # the collector notification.
+    poll_result_bytes = orjson.dumps(poll_result)
 
-    # transcript_filename = f"{timestamp.strftime('%H%M%S_%f')}_{transcribe_id}.json"
-    transcript_filename = f"{file_timestamp}.json"
-    transcript_path = directories["transcript"] / transcript_filename
-    _write_json_dump(transcript_path, poll_result)
+    transcript_path = directories["transcript"] / f"{file_timestamp}.json"
+    await asyncio.to_thread(transcript_path.write_bytes, poll_result_bytes)
 
-    collector_ok = await asyncio.to_thread(
-        _post_to_collector, settings, file_timestamp, poll_result_json
-    )
-    if not collector_ok:
-        logger.warning(
-            "Collector notification failed for %s; returning STT result anyway.",
-            file_timestamp,
-        )
+    if settings.collector_enabled:
+        # Fire-and-forget: the collector is a side-effect and must not hold
+        # up the STT response. Failures are logged by the worker.
+        _enqueue_collector_post(settings, file_timestamp, poll_result_bytes.decode())
 
     status = poll_result.get("status")
     if status != "completed":
@@ -3175,3 +3554,48 @@ async def stt_api(payload: STTRequest) -> STTResponse:
         result=SUCCESS_CODE,
         return_object=STTReturnObject(recognized=recognized),
     )
+
+
+@app.post("/stt_api", response_model=STTResponse)
+async def stt_api(payload: STTRequest) -> Union[STTResponse, Response]:
+    """Synchronous-style STT delegation endpoint."""
+    try:
+        settings = get_settings()
+    except RuntimeError as exc:
+        return _build_failure_response(str(exc))
+
+    if payload.argument.language_code.lower() != "korean":
+        return _static_failure_response("Unsupported language_code. Expected 'korean'.")
+
+    try:
+        # binascii.a2b_base64 accepts str input directly, skipping the
+        # full-size ASCII-encode intermediate base64.b64decode would make;
+        # run it off-loop so multi-MB clips don't stall streaming sessions.
+        audio_bytes = await asyncio.to_thread(
+            binascii.a2b_base64, payload.argument.audio
+        )
+    except (binascii.Error, ValueError):
+        return _static_failure_response("Invalid base64-encoded audio payload.")
+
+    return await _delegate_stt(settings, audio_bytes, payload.argument.language_code)
+
+
+@app.post("/stt_api_binary", response_model=STTResponse)
+async def stt_api_binary(
+    file: UploadFile = File(...),
+    language_code: str = Form("korean"),
+) -> Union[STTResponse, Response]:
+    """Binary variant of /stt_api: raw audio upload, no base64 round-trip."""
+    try:
+        settings = get_settings()
+    except RuntimeError as exc:
+        return _build_failure_response(str(exc))
+
+    if language_code.lower() != "korean":
+        return _static_failure_response("Unsupported language_code. Expected 'korean'.")
+
+    audio_bytes = await file.read()
+    if not audio_bytes:
+        return _static_failure_response("Uploaded audio file is empty.")
+
+    return await _delegate_stt(settings, audio_bytes, language_code)
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+from collections import deque
 from dataclasses import dataclass
 import inspect
-import json
 import logging
 import re
 import time
@@ -15,7 +15,7 @@ from urllib.parse import quote, urlencode, urlparse
 
 import grpc
 import httpx
-from google.protobuf import json_format
+import orjson
 import websockets
 from websockets.client import WebSocketClientProtocol
 
@@ -81,6 +81,7 @@ except ModuleNotFoundError as exc:
             self._sess = httpx.AsyncClient()
             self._cached_token: Optional[str] = None
             self._token_expires_at: Optional[float] = None
+            self._token_refresh_future: Optional[asyncio.Future[str]] = None
 
         async def _get_token(self) -> Optional[str]:
             now = time.time()
@@ -91,6 +92,27 @@ except ModuleNotFoundError as exc:
             if not self.client_id or not self.client_secret:
                 return None
 
+            # Single-flight refresh: concurrent callers await the same
+            # in-progress authenticate call instead of each issuing one.
+            if self._token_refresh_future is not None:
+                return await self._token_refresh_future
+
+            future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+            self._token_refresh_future = future
+            try:
+                token = await self._refresh_token(now)
+            except BaseException as exc:
+                future.set_exception(exc)
+                # Mark retrieved in case no other caller is waiting.
+                future.exception()
+                raise
+            else:
+                future.set_result(token)
+                return token
+            finally:
+                self._token_refresh_future = None
+
+        async def _refresh_token(self, now: float) -> str:
             response = await self._sess.post(
                 f"{self.api_base}/v1/authenticate",
                 data={
@@ -99,16 +121,20 @@ except ModuleNotFoundError as exc:
                 },
             )
             response.raise_for_status()
-            payload = response.json()
+            payload = orjson.loads(response.content)
             access_token = payload.get("access_token")
             token = access_token.strip() if isinstance(access_token, str) else ""
             if not token:
                 raise RuntimeError("RTZR authentication response missing access_token.")
 
+            # RTZR returns a numeric epoch; only fall back to the suppressed
+            # float() parse for an unexpected string value.
             expire_at_raw = payload.get("expire_at")
             expire_at: Optional[float] = None
-            if expire_at_raw is not None:
-                with contextlib.suppress(TypeError, ValueError):
+            if isinstance(expire_at_raw, (int, float)):
+                expire_at = float(expire_at_raw)
+            elif isinstance(expire_at_raw, str):
+                with contextlib.suppress(ValueError):
                     expire_at = float(expire_at_raw)
 
             self._cached_token = token
@@ -125,7 +151,7 @@ except ModuleNotFoundError as exc:
                 headers=await self._build_auth_headers(),
             )
             response.raise_for_status()
-            return dict(response.json())
+            return dict(orjson.loads(response.content))
 
         async def aclose(self) -> None:
             await self._sess.aclose()
@@ -171,6 +197,11 @@ if _SDK_IMPORT_ERROR is not None:
 _CONNECT_SUPPORTS_ADDITIONAL_HEADERS = (
     "additional_headers" in inspect.signature(websockets.connect).parameters
 )
+# websockets renamed ``extra_headers`` to ``additional_headers`` in v14; resolve
+# the keyword once so per-connect calls don't re-branch on the signature.
+_WS_HEADER_KW = (
+    "additional_headers" if _CONNECT_SUPPORTS_ADDITIONAL_HEADERS else "extra_headers"
+)
 
 # Mirrors python_api/api_server/example.py defaults so the upstream accepts the stream.
 DEFAULT_STREAMING_CONFIG: Dict[str, str] = {
@@ -181,12 +212,54 @@ DEFAULT_STREAMING_CONFIG: Dict[str, str] = {
     "use_profanity_filter": "false",
 }
 
+# The defaults are ASCII-safe, so their query string never changes.
+_DEFAULT_STREAMING_QUERY = urlencode(DEFAULT_STREAMING_CONFIG)
+
+_TRUTHY_STRINGS = frozenset({"1", "true", "yes", "y"})
+_FALSY_STRINGS = frozenset({"0", "false", "no", "n"})
+
 _INTERNAL_PHASE_BY_HOST: dict[str, Literal["dev", "sandbox"]] = {
     "dev-openapi.vito.ai": "dev",
     "sandbox-openapi.vito.ai": "sandbox",
 }
 _GRPC_METADATA_KEY_RE = re.compile(r"[^0-9a-z_.-]+")
 
+def _hashable_config_key(config: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    """Hashable snapshot of a streaming config, or None if uncacheable.
+
+    Streaming configs are flat dicts of scalars plus an optional nested
+    ``stream_config`` dict; anything deeper falls back to the uncached path.
+    """
+    if not config:
+        return ()
+    items = []
+    try:
+        for key in sorted(config):
+            value = config[key]
+            if isinstance(value, dict):
+                value = tuple(sorted(value.items()))
+            elif isinstance(value, (list, tuple)):
+                value = tuple(value)
+            items.append((key, value))
+        frozen = tuple(items)
+        hash(frozen)
+    except TypeError:
+        return None
+    return frozen
+
+
+# Field support depends only on the compiled proto, so resolve it once at
+# import instead of probing descriptors on every stream start.
+_DECODER_CONFIG_FIELDS = frozenset(stt_pb2.DecoderConfig.DESCRIPTOR.fields_by_name)
+_RUNTIME_STREAM_FIELDS = frozenset(
+    stt_pb2.RuntimeStreamConfig.DESCRIPTOR.fields_by_name
+)
+_AUDIO_ENCODINGS = {
+    value.name: value.number
+    for value in stt_pb2.DecoderConfig.AudioEncoding.DESCRIPTOR.values
+}
+_DEFAULT_AUDIO_ENCODING = _AUDIO_ENCODINGS["LINEAR16"]
+
 
 def _normalize_grpc_metadata_key(key: Any) -> Optional[str]:
     normalized = _GRPC_METADATA_KEY_RE.sub("-", str(key).strip().lower()).strip("-")
@@ -218,6 +291,20 @@ def _normalize_grpc_metadata(metadata: Optional[Dict[str, Any]]) -> Dict[str, st
     return normalized
 
 
+def _build_grpc_channel(
+    target: str, use_tls: bool, verify_ssl: bool
+) -> grpc.aio.Channel:
+    """Construct an aio channel for the upstream decoder."""
+    if use_tls:
+        credentials = grpc.ssl_channel_credentials()
+        options = None
+        if not verify_ssl:
+            host_override = target.split(":", 1)[0]
+            options = (("grpc.ssl_target_name_override", host_override),)
+        return grpc.aio.secure_channel(target, credentials, options=options)
+    return grpc.aio.insecure_channel(target)
+
+
 class GrpcStreamingSession:
     """Lightweight async adapter around the gRPC bidirectional stream."""
 
@@ -227,61 +314,66 @@ class GrpcStreamingSession:
         use_tls: bool,
         verify_ssl: bool,
         metadata: Optional[Dict[str, str]] = None,
+        channel: Optional[grpc.aio.Channel] = None,
     ):
         self._target = target
         self._use_tls = use_tls
         self._verify_ssl = verify_ssl
         self._metadata = metadata or {}
-        self._channel: Optional[grpc.aio.Channel] = None
+        # A borrowed channel (shared by the owning client) survives session
+        # close; a session-built one is torn down with the session.
+        self._channel: Optional[grpc.aio.Channel] = channel
+        self._owns_channel = channel is None
         self._call: Optional[grpc.aio.StreamStreamCall] = None
-        self._recv_queue: asyncio.Queue[Optional[stt_pb2.DecoderResponse]] = asyncio.Queue()
+        # Single producer (_recv_loop) / single consumer (recv), so a plain
+        # deque plus an Event avoids asyncio.Queue's waiter-future machinery
+        # on every partial result.
+        self._recv_buf: deque[Optional[stt_pb2.DecoderResponse]] = deque()
+        self._recv_ready = asyncio.Event()
         self._recv_task: Optional[asyncio.Task[None]] = None
         self._last_error: Optional[BaseException] = None
         self._closed = False
         self._send_lock = asyncio.Lock()
+        # Reused for every audio frame; grpc.aio serializes the message inside
+        # write() before it returns, so mutating it for the next frame is safe.
+        self._audio_request = stt_pb2.DecoderRequest()
 
-    async def start(self, decoder_config: stt_pb2.DecoderConfig) -> None:
-        """Open the bidirectional stream and push the initial config."""
-        if self._channel:
+    async def start(self, initial_request: stt_pb2.DecoderRequest) -> None:
+        """Open the bidirectional stream and push the initial config request."""
+        if self._call:
             return
-        if self._use_tls:
-            credentials = grpc.ssl_channel_credentials()
-            options = None
-            if not self._verify_ssl:
-                host_override = self._target.split(":", 1)[0]
-                options = (("grpc.ssl_target_name_override", host_override),)
-            self._channel = grpc.aio.secure_channel(
-                self._target,
-                credentials,
-                options=options,
+        if self._channel is None:
+            self._channel = _build_grpc_channel(
+                self._target, self._use_tls, self._verify_ssl
             )
-        else:
-            self._channel = grpc.aio.insecure_channel(self._target)
 
         stub = stt_pb2_grpc.OnlineDecoderStub(self._channel)
-        metadata = list((str(k), str(v)) for k, v in self._metadata.items())
-        self._call = stub.Decode(metadata=metadata or None)
-        await self._call.write(
-            stt_pb2.DecoderRequest(streaming_config=decoder_config)
-        )
+        # Metadata arrives normalized to str pairs (_normalize_grpc_metadata),
+        # so hand it to gRPC as-is.
+        metadata = tuple(self._metadata.items()) if self._metadata else None
+        self._call = stub.Decode(metadata=metadata)
+        await self._call.write(initial_request)
         self._recv_task = asyncio.create_task(self._recv_loop())
 
     async def _recv_loop(self) -> None:
         try:
             assert self._call is not None
             async for resp in self._call:
-                await self._recv_queue.put(resp)
+                self._recv_buf.append(resp)
+                self._recv_ready.set()
         except Exception as exc:  # pragma: no cover - network failures
             self._last_error = exc
         finally:
-            await self._recv_queue.put(None)
+            self._recv_buf.append(None)
+            self._recv_ready.set()
 
     async def send_audio(self, data: bytes) -> None:
         """Send a raw audio chunk upstream."""
         if not self._call:
             raise RuntimeError("gRPC stream is not started.")
         async with self._send_lock:
-            await self._call.write(stt_pb2.DecoderRequest(audio_content=data))
+            self._audio_request.audio_content = data
+            await self._call.write(self._audio_request)
 
     async def finish(self) -> None:
         """Half-close the client stream and wait for remaining responses."""
@@ -291,7 +383,12 @@ class GrpcStreamingSession:
 
     async def recv(self) -> Optional[stt_pb2.DecoderResponse]:
         """Pop the next upstream response or None if the stream ended."""
-        message = await self._recv_queue.get()
+        # No await can interleave between the emptiness check and clear(),
+        # so a producer append cannot be lost before wait().
+        while not self._recv_buf:
+            self._recv_ready.clear()
+            await self._recv_ready.wait()
+        message = self._recv_buf.popleft()
         if message is None:
             self._closed = True
         return message
@@ -306,7 +403,7 @@ class GrpcStreamingSession:
         if self._call:
             with contextlib.suppress(Exception):
                 await self._call.aclose()
-        if self._channel:
+        if self._channel and self._owns_channel:
             with contextlib.suppress(Exception):
                 await self._channel.close()
 
@@ -390,11 +487,20 @@ class _ManualTokenAsyncInternalRtzr(AsyncInternalRtzr):
         return await super()._get_token()
 
 
-def _build_async_http_client(*, verify_ssl: bool) -> httpx.AsyncClient:
+def _build_async_http_client(
+    *, verify_ssl: bool, max_connections: int = 100, max_keepalive: int = 20
+) -> httpx.AsyncClient:
     """Prefer HTTP/2 when available, but stay usable in lean local environments."""
     client_kwargs = {
         "verify": verify_ssl,
         "timeout": httpx.Timeout(connect=30.0, read=60.0, write=60.0, pool=60.0),
+        # Keep idle connections warm for a minute so status-poll bursts
+        # don't pay TLS setup again; pool sizing is operator-tunable.
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=60.0,
+        ),
     }
     try:
         return httpx.AsyncClient(http2=True, **client_kwargs)
@@ -405,10 +511,16 @@ def _build_async_http_client(*, verify_ssl: bool) -> httpx.AsyncClient:
         return httpx.AsyncClient(http2=False, **client_kwargs)
 
 
-def _replace_sdk_session(sdk: Any, *, verify_ssl: bool) -> httpx.AsyncClient:
+def _replace_sdk_session(
+    sdk: Any, *, verify_ssl: bool, max_connections: int = 100, max_keepalive: int = 20
+) -> httpx.AsyncClient:
     """Swap the SDK-managed AsyncClient so we control TLS + HTTP/2 behavior."""
     stale_session = sdk._sess
-    sdk._sess = _build_async_http_client(verify_ssl=verify_ssl)
+    sdk._sess = _build_async_http_client(
+        verify_ssl=verify_ssl,
+        max_connections=max_connections,
+        max_keepalive=max_keepalive,
+    )
     return stale_session
 
 
@@ -436,7 +548,12 @@ class CloudApiAdapter:
             self._sdk = _ManualTokenAsyncRtzr(**common_kwargs)
 
         self._stale_sessions: list[httpx.AsyncClient] = [
-            _replace_sdk_session(self._sdk, verify_ssl=settings.verify_ssl)
+            _replace_sdk_session(
+                self._sdk,
+                verify_ssl=settings.verify_ssl,
+                max_connections=settings.http_max_connections,
+                max_keepalive=settings.http_max_keepalive,
+            )
         ]
 
     @property
@@ -460,7 +577,7 @@ class CloudApiAdapter:
         """Submit batch audio through the SDK-authenticated HTTP session."""
         request_config = self._normalize_batch_config(config)
         headers = await self._sdk._build_auth_headers()
-        data: Dict[str, Any] = {"config": json.dumps(request_config)}
+        data: Dict[str, Any] = {"config": orjson.dumps(request_config).decode()}
         if title:
             data["title"] = title
 
@@ -471,7 +588,7 @@ class CloudApiAdapter:
             files={"file": ("audio.wav", audio_bytes)},
         )
         response.raise_for_status()
-        payload = dict(response.json())
+        payload = dict(orjson.loads(response.content))
         transcribe_id = (
             payload.get("transcribe_id") or payload.get("id") or payload.get("tid")
         )
@@ -533,32 +650,61 @@ class RTZRClient:
         self._api_base = settings.pronaia_api_base.rstrip("/")
         self._manual_token = (settings.pronaia_access_token or "").strip()
         self._deployment = settings.deployment
+        # The on-prem token is fixed at init, so the auth headers and gRPC
+        # bearer value can be precomputed instead of reformatted per call.
+        if self._deployment == "onprem" and self._manual_token:
+            self._onprem_http_headers: Dict[str, str] = {
+                "Authorization": f"Bearer {self._manual_token}"
+            }
+            self._onprem_ws_headers: Dict[str, str] = {
+                "Authorization": f"bearer {self._manual_token}"
+            }
+            self._onprem_grpc_bearer: Optional[str] = f"bearer {self._manual_token}"
+        else:
+            self._onprem_http_headers = {}
+            self._onprem_ws_headers = {}
+            self._onprem_grpc_bearer = None
         self._transcribe_path = settings.transcribe_path
         self._transcribe_status_path = settings.transcribe_status_path
         self._streaming_path = settings.streaming_path
         self._verify_ssl = settings.verify_ssl
+        # Sessions usually reconnect with the same config, so cache the
+        # derived streaming URL and initial DecoderRequest per config key.
+        self._streaming_url_cache: Dict[tuple, str] = {}
+        self._initial_request_cache: Dict[tuple, stt_pb2.DecoderRequest] = {}
+        # One HTTP/2 channel serves every streaming session; gRPC multiplexes
+        # concurrent Decode calls over it, so reconnecting clients skip the
+        # TCP/TLS handshake. Only touched from the event-loop thread.
+        self._grpc_channel: Optional[grpc.aio.Channel] = None
+        # The API base is immutable after init, so the parsed gRPC target
+        # and websocket base URL are computed at most once.
+        self._grpc_target_cache: Optional[tuple[str, bool]] = None
+        self._streaming_base_url_cache: Optional[str] = None
         self._cloud_api: Optional[CloudApiAdapter] = None
         if self._deployment == "cloud":
             self._cloud_api = CloudApiAdapter(settings)
         else:
-            self._session = _build_async_http_client(verify_ssl=settings.verify_ssl)
-
-    async def _resolve_access_token(self) -> Optional[str]:
-        """Return a usable access token for non-SDK on-prem flows."""
-        if self._deployment != "onprem":
-            return None
-        return self._manual_token or None
+            self._session = _build_async_http_client(
+                verify_ssl=settings.verify_ssl,
+                max_connections=settings.http_max_connections,
+                max_keepalive=settings.http_max_keepalive,
+            )
 
     def _grpc_target(self) -> tuple[str, bool]:
         """Return target host:port and whether TLS should be used."""
+        if self._grpc_target_cache is not None:
+            return self._grpc_target_cache
         parsed = urlparse(self._api_base)
         if parsed.scheme:
             host = parsed.hostname
             port = parsed.port or (443 if parsed.scheme.lower() == "https" else 80)
             if not host:
                 raise RuntimeError("Invalid API base URL for gRPC streaming.")
-            return f"{host}:{port}", parsed.scheme.lower().startswith("https")
-        return self._api_base, False
+            target = f"{host}:{port}", parsed.scheme.lower().startswith("https")
+        else:
+            target = self._api_base, False
+        self._grpc_target_cache = target
+        return target
 
     @staticmethod
     def _coerce_int(value: Any, default: Optional[int] = None) -> Optional[int]:
@@ -580,9 +726,9 @@ class RTZRClient:
             return value
         if isinstance(value, str):
             lowered = value.strip().lower()
-            if lowered in {"1", "true", "yes", "y"}:
+            if lowered in _TRUTHY_STRINGS:
                 return True
-            if lowered in {"0", "false", "no", "n"}:
+            if lowered in _FALSY_STRINGS:
                 return False
         if isinstance(value, (int, float)):
             if value == 1:
@@ -608,20 +754,6 @@ class RTZRClient:
             return cleaned or None
         return None
 
-    @staticmethod
-    def _has_field(message: Any, field_name: str) -> bool:
-        descriptor = getattr(message, "DESCRIPTOR", None)
-        if descriptor is None:
-            return False
-        return field_name in descriptor.fields_by_name
-
-    @staticmethod
-    def _set_field_if_supported(message: Any, field_name: str, value: Any) -> None:
-        if value is None:
-            return
-        if RTZRClient._has_field(message, field_name):
-            setattr(message, field_name, value)
-
     def _build_decoder_config(
         self, config: Optional[Dict[str, Any]] = None
     ) -> stt_pb2.DecoderConfig:
@@ -631,44 +763,41 @@ class RTZRClient:
 
         sample_rate = self._coerce_int(merged.get("sample_rate"), 16000) or 16000
         encoding_str = str(merged.get("encoding") or "LINEAR16").strip().upper()
-        encoding_value = getattr(
-            stt_pb2.DecoderConfig.AudioEncoding, encoding_str, None
-        )
-        if not isinstance(encoding_value, int):
-            encoding_value = stt_pb2.DecoderConfig.AudioEncoding.LINEAR16
+        encoding_value = _AUDIO_ENCODINGS.get(encoding_str, _DEFAULT_AUDIO_ENCODING)
 
         decoder_config = stt_pb2.DecoderConfig(
             sample_rate=sample_rate,
             encoding=encoding_value,
         )
 
+        def set_supported(field_name: str, value: Any) -> None:
+            if value is not None and field_name in _DECODER_CONFIG_FIELDS:
+                setattr(decoder_config, field_name, value)
+
         model_name = (merged.get("model_name") or merged.get("model") or "").strip()
-        self._set_field_if_supported(decoder_config, "model_name", model_name or None)
+        set_supported("model_name", model_name or None)
 
         language = (merged.get("language") or merged.get("lang") or "").strip()
-        self._set_field_if_supported(decoder_config, "language", language or None)
+        set_supported("language", language or None)
 
         domain = (merged.get("domain") or "").strip()
-        self._set_field_if_supported(decoder_config, "domain", domain or None)
+        set_supported("domain", domain or None)
 
-        use_itn = self._coerce_bool(merged.get("use_itn"))
-        self._set_field_if_supported(decoder_config, "use_itn", use_itn)
-
-        use_disfluency = self._coerce_bool(merged.get("use_disfluency_filter"))
-        self._set_field_if_supported(
-            decoder_config, "use_disfluency_filter", use_disfluency
+        set_supported("use_itn", self._coerce_bool(merged.get("use_itn")))
+        set_supported(
+            "use_disfluency_filter",
+            self._coerce_bool(merged.get("use_disfluency_filter")),
         )
-
-        use_profanity = self._coerce_bool(merged.get("use_profanity_filter"))
-        self._set_field_if_supported(
-            decoder_config, "use_profanity_filter", use_profanity
+        set_supported(
+            "use_profanity_filter",
+            self._coerce_bool(merged.get("use_profanity_filter")),
+        )
+        set_supported(
+            "use_punctuation", self._coerce_bool(merged.get("use_punctuation"))
         )
-
-        use_punctuation = self._coerce_bool(merged.get("use_punctuation"))
-        self._set_field_if_supported(decoder_config, "use_punctuation", use_punctuation)
 
         keywords = self._coerce_keywords(merged.get("keywords"))
-        if keywords and self._has_field(decoder_config, "keywords"):
+        if keywords and "keywords" in _DECODER_CONFIG_FIELDS:
             decoder_config.keywords.extend(keywords)
 
         stream_config_payload = merged.get("stream_config")
@@ -686,9 +815,14 @@ class RTZRClient:
         max_utter_duration = self._coerce_int(
             merged.get("max_utter_duration"), max_utter_duration
         )
-        self._set_field_if_supported(stream_config, "max_utter_duration", max_utter_duration)
-        self._set_field_if_supported(stream_config, "epd_time", epd_time)
-        if stream_config.ListFields() and self._has_field(decoder_config, "stream_config"):
+        if (
+            max_utter_duration is not None
+            and "max_utter_duration" in _RUNTIME_STREAM_FIELDS
+        ):
+            stream_config.max_utter_duration = max_utter_duration
+        if epd_time is not None and "epd_time" in _RUNTIME_STREAM_FIELDS:
+            stream_config.epd_time = epd_time
+        if stream_config.ListFields() and "stream_config" in _DECODER_CONFIG_FIELDS:
             decoder_config.stream_config.CopyFrom(stream_config)
 
         return decoder_config
@@ -700,19 +834,23 @@ class RTZRClient:
     ) -> GrpcStreamingSession:
         """Establish an upstream gRPC streaming session."""
         target, use_tls = self._grpc_target()
-        token = await self._resolve_access_token()
         meta = _normalize_grpc_metadata(metadata)
-        if token:
-            meta.setdefault("authorization", f"bearer {token}")
+        if self._onprem_grpc_bearer:
+            meta.setdefault("authorization", self._onprem_grpc_bearer)
+
+        if self._grpc_channel is None:
+            self._grpc_channel = _build_grpc_channel(
+                target, use_tls, self._verify_ssl
+            )
 
-        decoder_config = self._build_decoder_config(config)
         session = GrpcStreamingSession(
             target=target,
             use_tls=use_tls,
             verify_ssl=self._verify_ssl,
             metadata=meta,
+            channel=self._grpc_channel,
         )
-        await session.start(decoder_config)
+        await session.start(self._initial_request_for(config))
         return session
 
     async def submit_transcription(
@@ -730,24 +868,19 @@ class RTZRClient:
             )
 
         assert self._session is not None
-        headers: Dict[str, str] = {}
-        token = await self._resolve_access_token()
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-
-        data: Dict[str, Any] = {"config": json.dumps(config or {})}
+        data: Dict[str, Any] = {"config": orjson.dumps(config or {}).decode()}
         if title:
             data["title"] = title
         files = {"file": ("audio.wav", audio_bytes)}
         resp = await self._session.post(
             self._build_url(self._transcribe_path),
-            headers=headers,
+            headers=self._onprem_http_headers,
             data=data,
             files=files,
             timeout=60,
         )
         resp.raise_for_status()
-        payload = resp.json()
+        payload = orjson.loads(resp.content)
         job_id = payload.get("id") or payload.get("tid") or payload.get("transcribe_id")
         if not job_id:
             raise RuntimeError("Transcribe response missing 'id'.")
@@ -761,18 +894,13 @@ class RTZRClient:
             return await self._cloud_api.get_transcription(job_id)
 
         assert self._session is not None
-        headers: Dict[str, str] = {}
-        token = await self._resolve_access_token()
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-
         resp = await self._session.get(
             self._build_url(self._transcribe_status_path.format(transcribe_id=job_id)),
-            headers=headers,
+            headers=self._onprem_http_headers,
             timeout=30,
         )
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     def _build_url(self, path: str) -> str:
         """Join the API base with a relative path."""
@@ -795,15 +923,21 @@ class RTZRClient:
         self, config: Optional[Dict[str, Any]] = None
     ) -> str:
         """Construct the streaming URL with query parameters mirroring the SDK example."""
-        streaming_path = self._streaming_path.lstrip("/")
-        if self._cloud_api is not None:
-            base_url = f"{self._cloud_api.websocket_base}/{streaming_path}"
-        else:
-            if "://" not in self._api_base:
-                raise RuntimeError("Invalid API base URL for streaming")
-            host_and_path = self._api_base.split("://", 1)[1].rstrip("/")
-            scheme = "wss" if self._api_base.lower().startswith("https://") else "ws"
-            base_url = f"{scheme}://{host_and_path}/{streaming_path}"
+        base_url = self._streaming_base_url_cache
+        if base_url is None:
+            streaming_path = self._streaming_path.lstrip("/")
+            if self._cloud_api is not None:
+                base_url = f"{self._cloud_api.websocket_base}/{streaming_path}"
+            else:
+                if "://" not in self._api_base:
+                    raise RuntimeError("Invalid API base URL for streaming")
+                host_and_path = self._api_base.split("://", 1)[1].rstrip("/")
+                scheme = "wss" if self._api_base.lower().startswith("https://") else "ws"
+                base_url = f"{scheme}://{host_and_path}/{streaming_path}"
+            self._streaming_base_url_cache = base_url
+
+        if not config:
+            return f"{base_url}?{_DEFAULT_STREAMING_QUERY}"
 
         merged_config: Dict[str, str] = DEFAULT_STREAMING_CONFIG.copy()
         if config:
@@ -823,9 +957,41 @@ class RTZRClient:
         query = urlencode(merged_config)
         return f"{base_url}?{query}" if query else base_url
 
+    def _initial_request_for(
+        self, config: Optional[Dict[str, Any]] = None
+    ) -> stt_pb2.DecoderRequest:
+        """Build the stream-opening DecoderRequest, reused for repeat configs.
+
+        The cached message is shared across sessions; it is only ever
+        serialized by gRPC, never mutated.
+        """
+        key = _hashable_config_key(config)
+        if key is not None:
+            cached = self._initial_request_cache.get(key)
+            if cached is not None:
+                return cached
+        request = stt_pb2.DecoderRequest(
+            streaming_config=self._build_decoder_config(config)
+        )
+        if key is not None:
+            if len(self._initial_request_cache) >= 32:
+                self._initial_request_cache.clear()
+            self._initial_request_cache[key] = request
+        return request
+
     def get_streaming_url(self, config: Optional[Dict[str, Any]] = None) -> str:
         """Expose the websocket URL used for upstream streaming connections."""
-        return self._build_streaming_url(config=config)
+        key = _hashable_config_key(config)
+        if key is not None:
+            cached = self._streaming_url_cache.get(key)
+            if cached is not None:
+                return cached
+        url = self._build_streaming_url(config=config)
+        if key is not None:
+            if len(self._streaming_url_cache) >= 32:
+                self._streaming_url_cache.clear()
+            self._streaming_url_cache[key] = url
+        return url
 
     async def connect_streaming(
         self, config: Optional[Dict[str, Any]] = None
@@ -835,22 +1001,14 @@ class RTZRClient:
         if self._cloud_api is not None:
             headers = await self._cloud_api.build_auth_headers()
         else:
-            token = await self._resolve_access_token()
-            headers = {}
-            if token:
-                headers["Authorization"] = f"bearer {token}"
+            headers = self._onprem_ws_headers
 
         connect_kwargs: Dict[str, Any] = {
             "ping_interval": None,
             "max_size": None,
         }
         if headers:
-            header_key = (
-                "additional_headers"
-                if _CONNECT_SUPPORTS_ADDITIONAL_HEADERS
-                else "extra_headers"
-            )
-            connect_kwargs[header_key] = headers
+            connect_kwargs[_WS_HEADER_KW] = headers
 
         return await websockets.connect(
             url,
@@ -858,8 +1016,12 @@ class RTZRClient:
         )
 
     async def aclose(self) -> None:
-        """Close the underlying HTTP client."""
+        """Close the underlying HTTP client and the shared gRPC channel."""
         if self._cloud_api is not None:
             await self._cloud_api.aclose()
         if self._session is not None:
             await self._session.aclose()
+        if self._grpc_channel is not None:
+            with contextlib.suppress(Exception):
+                await self._grpc_channel.close()
+            self._grpc_channel = None
@@ -18,6 +18,10 @@ class FakeResponse:
         self._payload = payload
         self.status_code = status_code
 
+    @property
+    def content(self) -> bytes:
+        return json.dumps(self._payload).encode()
+
     def json(self) -> dict[str, Any]:
         return dict(self._payload)
 
@@ -1,4 +1,5 @@
 import asyncio
+import io
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -46,10 +47,12 @@ def make_settings(
     *,
     concurrency: int = 1,
     timeout_seconds: float = 1.0,
+    storage_base_dir: Path | None = None,
 ) -> SimpleNamespace:
     return SimpleNamespace(
         transcribe_queue_concurrency=concurrency,
         transcribe_queue_timeout_seconds=timeout_seconds,
+        storage_base_dir=storage_base_dir,
     )
 
 
@@ -57,6 +60,9 @@ class FakeUploadFile:
     filename = "sample.wav"
     content_type = "audio/wav"
 
+    def __init__(self) -> None:
+        self.file = io.BytesIO(b"audio")
+
     async def read(self) -> bytes:
         return b"audio"
 
@@ -99,11 +105,13 @@ def test_transcribe_queue_timeout_returns_api_error() -> None:
 
 
 def test_proxy_transcribe_preserves_queue_timeout_api_error(
-    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     reset_queue_state()
     client = FakeTranscribeClient()
-    settings = make_settings(concurrency=1, timeout_seconds=0.001)
+    settings = make_settings(
+        concurrency=1, timeout_seconds=0.001, storage_base_dir=tmp_path
+    )
     monkeypatch.setattr(main, "_ensure_settings", lambda: settings)
     monkeypatch.setattr(main, "_get_client", lambda _settings: client)
 
@@ -130,16 +138,21 @@ def test_persist_uploaded_audio_cleans_partial_artifacts_on_metadata_write_failu
 ) -> None:
     settings = SimpleNamespace(storage_base_dir=tmp_path)
     artifacts = main._audio_artifacts(settings, "job-a")
-    real_write_text = Path.write_text
+    real_write_bytes = Path.write_bytes
 
-    def fail_meta_write(self: Path, data: str, *args: Any, **kwargs: Any) -> int:
+    def fail_meta_write(self: Path, data: bytes, *args: Any, **kwargs: Any) -> int:
         if self == artifacts["meta"]:
             raise OSError("metadata write failed")
-        return real_write_text(self, data, *args, **kwargs)
+        return real_write_bytes(self, data, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_bytes", fail_meta_write)
 
-    monkeypatch.setattr(Path, "write_text", fail_meta_write)
+    spool_path = tmp_path / ".upload-job-a.part"
+    real_write_bytes(spool_path, b"audio")
 
-    audio_path = main._persist_uploaded_audio(settings, "job-a", FakeUploadFile(), b"audio")
+    audio_path = main._persist_uploaded_audio(
+        settings, "job-a", FakeUploadFile(), spool_path
+    )
 
     assert audio_path is None
     assert not artifacts["data"].exists()
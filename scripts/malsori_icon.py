@@ -4,8 +4,8 @@
 from __future__ import annotations
 
 import argparse
+import re
 from pathlib import Path
-import xml.etree.ElementTree as ET
 
 
 WHITE = "#ffffff"
@@ -35,46 +35,57 @@ MAL_GLYPH_BOUNDS = (97.0, -105.0, 932.0, 842.0)
 
 def fmt(value: float) -> str:
     """Format floats for SVG output without trailing zeros."""
-    return f"{value:.3f}".rstrip("0").rstrip(".")
+    # ".3f" always yields a decimal point, so one suffix check plus a single
+    # rstrip replaces the rstrip("0").rstrip(".") chain.
+    text = f"{value:.3f}"
+    return text[:-4] if text.endswith(".000") else text.rstrip("0")
+
+
+# The icon topology is fixed, so the whole document is one template; only the
+# size-dependent values are substituted per build.
+SVG_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" '
+    'viewBox="0 0 {size} {size}" width="{size}" height="{size}" '
+    'role="img" aria-label="Malsori mal and sound icon">\n'
+    "  <title>Malsori mal and sound icon</title>\n"
+    '  <circle cx="{center}" cy="{center}" r="{radius}" fill="{bg_color}" />\n'
+    '  <path d="{glyph_d}" fill="{fg}" transform="{glyph_transform}" />\n'
+    '  <rect x="{back_x}" y="{back_y}" width="{back_width}" height="{back_height}" '
+    'rx="{back_rx}" fill="{fg}" />\n'
+    '  <path d="{cone_d}" fill="{fg}" />\n'
+    '  <g fill="none" stroke="{fg}" stroke-width="{wave_stroke}" stroke-linecap="round">\n'
+    '    <path d="{inner_wave_d}" />\n'
+    '    <path d="{outer_wave_d}" />\n'
+    "  </g>\n"
+    "</svg>"
+)
+
+# A digit before "0." (as in "240.64") means the zero is not a leading one.
+_LEADING_ZERO_RE = re.compile(r"(?<!\d)0\.")
+
+
+def minify_svg(text: str) -> str:
+    """Shrink the pretty SVG for production embedding (svgo-style)."""
+    text = text.replace("  <title>Malsori mal and sound icon</title>\n", "")
+    text = text.replace(' role="img" aria-label="Malsori mal and sound icon"', "")
+    # Path data never spans lines, so dropping the per-line indent is safe.
+    text = "".join(line.lstrip() for line in text.split("\n"))
+    return _LEADING_ZERO_RE.sub(".", text)
 
 
 def wave_path(origin_x: float, center_y: float, radius: float) -> str:
     bulge = radius * 0.9
+    origin_s = fmt(origin_x)
     return (
-        f"M {fmt(origin_x)} {fmt(center_y - radius)} "
-        f"Q {fmt(origin_x + bulge)} {fmt(center_y)} {fmt(origin_x)} {fmt(center_y + radius)}"
+        f"M {origin_s} {fmt(center_y - radius)} "
+        f"Q {fmt(origin_x + bulge)} {fmt(center_y)} {origin_s} {fmt(center_y + radius)}"
     )
 
 
-def build_icon(output: Path, *, size: float, bg_color: str) -> None:
+def build_icon(output: Path, *, size: float, bg_color: str, minify: bool = False) -> None:
     center = size / 2.0
     radius = size * 0.47
 
-    svg = ET.Element(
-        "svg",
-        attrib={
-            "xmlns": "http://www.w3.org/2000/svg",
-            "viewBox": f"0 0 {fmt(size)} {fmt(size)}",
-            "width": fmt(size),
-            "height": fmt(size),
-            "role": "img",
-            "aria-label": "Malsori mal and sound icon",
-        },
-    )
-    svg.append(ET.Element("title"))
-    svg[-1].text = "Malsori mal and sound icon"
-
-    ET.SubElement(
-        svg,
-        "circle",
-        attrib={
-            "cx": fmt(center),
-            "cy": fmt(center),
-            "r": fmt(radius),
-            "fill": bg_color,
-        },
-    )
-
     min_x, min_y, max_x, max_y = MAL_GLYPH_BOUNDS
     glyph_width = max_x - min_x
     glyph_height = max_y - min_y
@@ -89,35 +100,12 @@ def build_icon(output: Path, *, size: float, bg_color: str) -> None:
         f"translate({fmt(-min_x)} {fmt(-max_y)})"
     )
 
-    ET.SubElement(
-        svg,
-        "path",
-        attrib={
-            "d": MAL_GLYPH_PATH,
-            "fill": WHITE,
-            "transform": glyph_transform,
-        },
-    )
-
     speaker_back_width = size * 0.085
     speaker_back_height = size * 0.20
     speaker_back_x = size * 0.64
     speaker_back_y = center - (speaker_back_height / 2.0)
     speaker_corner = size * 0.017
 
-    ET.SubElement(
-        svg,
-        "rect",
-        attrib={
-            "x": fmt(speaker_back_x),
-            "y": fmt(speaker_back_y),
-            "width": fmt(speaker_back_width),
-            "height": fmt(speaker_back_height),
-            "rx": fmt(speaker_corner),
-            "fill": WHITE,
-        },
-    )
-
     cone_width = size * 0.15
     cone_height = size * 0.30
     cone_left = speaker_back_x + speaker_back_width
@@ -134,41 +122,56 @@ def build_icon(output: Path, *, size: float, bg_color: str) -> None:
         f"L {fmt(cone_left)} {fmt(cone_left_bottom)} Z"
     )
 
-    ET.SubElement(
-        svg,
-        "path",
-        attrib={
-            "d": cone_path,
-            "fill": WHITE,
-        },
-    )
-
-    wave_group = ET.SubElement(
-        svg,
-        "g",
-        attrib={
-            "fill": "none",
-            "stroke": WHITE,
-            "stroke-width": fmt(size * 0.032),
-            "stroke-linecap": "round",
-        },
-    )
     wave_origin = cone_right + (size * 0.02)
     wave_origin_outer = wave_origin + (size * 0.025)
     wave_inner_radius = size * 0.06
     wave_outer_radius = size * 0.09
 
-    ET.SubElement(wave_group, "path", attrib={"d": wave_path(wave_origin, center, wave_inner_radius)})
-    ET.SubElement(
-        wave_group,
-        "path",
-        attrib={"d": wave_path(wave_origin_outer, center, wave_outer_radius)},
+    text = SVG_TEMPLATE.format_map(
+        {
+            "size": fmt(size),
+            "center": fmt(center),
+            "radius": fmt(radius),
+            "bg_color": bg_color,
+            "fg": WHITE,
+            "glyph_d": MAL_GLYPH_PATH,
+            "glyph_transform": glyph_transform,
+            "back_x": fmt(speaker_back_x),
+            "back_y": fmt(speaker_back_y),
+            "back_width": fmt(speaker_back_width),
+            "back_height": fmt(speaker_back_height),
+            "back_rx": fmt(speaker_corner),
+            "cone_d": cone_path,
+            "wave_stroke": fmt(size * 0.032),
+            "inner_wave_d": wave_path(wave_origin, center, wave_inner_radius),
+            "outer_wave_d": wave_path(wave_origin_outer, center, wave_outer_radius),
+        }
     )
-
-    tree = ET.ElementTree(svg)
-    ET.indent(tree, space="  ")
+    if minify:
+        text = minify_svg(text)
     output.parent.mkdir(parents=True, exist_ok=True)
-    tree.write(output, encoding="utf-8", xml_declaration=False)
+    output.write_text(text, encoding="utf-8")
+
+
+def build_icons(
+    sizes: list[float],
+    output_dir: Path,
+    *,
+    bg_color: str = DEFAULT_BG_COLOR,
+    minify: bool = False,
+) -> None:
+    """Generate one favicon per size as malsori-{size}.svg in output_dir."""
+    for size in sizes:
+        build_icon(
+            output_dir / f"malsori-{fmt(size)}.svg",
+            size=size,
+            bg_color=bg_color,
+            minify=minify,
+        )
+
+
+def parse_sizes(raw: str) -> list[float]:
+    return [float(part) for part in raw.split(",") if part.strip()]
 
 
 def main() -> None:
@@ -192,8 +195,30 @@ def main() -> None:
         default=DEFAULT_BG_COLOR,
         help="Background circle color.",
     )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Strip the title, ARIA attributes, and whitespace for production builds.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=None,
+        help=(
+            "Comma-separated list of sizes (e.g. 16,32,64,180,512) to batch-generate "
+            "as malsori-{size}.svg next to --output; overrides --size."
+        ),
+    )
     args = parser.parse_args()
-    build_icon(args.output, size=args.size, bg_color=args.bg_color)
+    if args.sizes:
+        build_icons(
+            args.sizes,
+            args.output.parent,
+            bg_color=args.bg_color,
+            minify=args.minify,
+        )
+    else:
+        build_icon(args.output, size=args.size, bg_color=args.bg_color, minify=args.minify)
 
 
 if __name__ == "__main__":